@@ -15,26 +15,51 @@ except PackageNotFoundError:
 __author__ = "BGEO"
 __email__ = "info@bgeo.es"
 
+import importlib
+from typing import Any, List
+
 from .config import config
-from . import swmm
-from . import epanet
 from .exceptions import (
     HydraulicEngineError,
     FileLoadError,
     FileWriteError,
     UnsupportedFileTypeError,
 )
-from .utils import (
-    ExportDataSource,
-    create_pg_connection,
-    create_gpkg_connection,
-    create_sqlite_connection,
-    get_connection,
-    close_connection,
-    create_frost_connection,
-    get_api_client,
-    close_api_client,
-)
+
+# Heavy subpackages and re-exports (wntr, swmm-api, requests, ...) are imported on first
+# attribute access (PEP 562), so importing the package only costs the standard library.
+# name -> (module, attribute or None for the module itself)
+_LAZY_ATTRS = {
+    "swmm": (".swmm", None),
+    "epanet": (".epanet", None),
+    "ExportDataSource": (".utils", "ExportDataSource"),
+    "create_pg_connection": (".utils", "create_pg_connection"),
+    "create_gpkg_connection": (".utils", "create_gpkg_connection"),
+    "create_sqlite_connection": (".utils", "create_sqlite_connection"),
+    "get_connection": (".utils", "get_connection"),
+    "close_connection": (".utils", "close_connection"),
+    "create_frost_connection": (".utils", "create_frost_connection"),
+    "get_api_client": (".utils", "get_api_client"),
+    "close_api_client": (".utils", "close_api_client"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = importlib.import_module(module_name, __name__)
+    if attr is not None:
+        value = getattr(value, attr)
+    # Cache on the module so later lookups don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "__version__",
@@ -5,6 +5,7 @@ General Public License as published by the Free Software Foundation, either vers
 or (at your option) any later version.
 """
 # -*- coding: utf-8 -*-
+import os
 import wntr
 
 from typing import Dict, List, Optional
@@ -179,6 +180,10 @@ class EpanetBinHandler(EpanetFileHandler, EpanetResultHandler):
             tools_log.log_error("No INP file loaded")
             return False
 
+        # INP path metadata, resolved once for the whole export
+        inp_file = inp_handler.file_path
+        inp_filename = os.path.basename(inp_file)
+
         # Determine simulation start time
         if start_time is None:
             start_time = datetime.now(timezone.utc) + timedelta(seconds=inp_handler.file_object.options.time.start_clocktime)
@@ -186,7 +191,7 @@ class EpanetBinHandler(EpanetFileHandler, EpanetResultHandler):
 
         # Pre-fetch existing entities (optimized: 2 API calls instead of N)
         tools_log.log_info("Fetching existing entities from server...")
-        things_cache = tools_sensorthings.get_all_things_with_locations(client)
+        things_cache = tools_sensorthings.get_all_things_with_locations(client, max_workers=max_workers)
         obs_props_cache = tools_sensorthings.get_all_observed_properties(client)
         tools_log.log_info(f"Found {len(things_cache)} existing Things and {len(obs_props_cache)} ObservedProperties")
 
@@ -201,8 +206,9 @@ class EpanetBinHandler(EpanetFileHandler, EpanetResultHandler):
         sensor_ids = tools_sensorthings.create_simulation_sensor(
             result_id=result_id,
             network_type='EPANET',
-            inp_file=inp_handler.file_path,
-            client=client
+            inp_file=inp_file,
+            client=client,
+            inp_filename=inp_filename
         )
 
         # Set up coordinate transformer
@@ -693,6 +699,11 @@ def _prepare_nodes_things_data(
 ) -> List[Dict]:
     """Prepare Thing data for nodes (no HTTP calls)."""
     things_data = []
+    # Reference dicts shared by every Datastream body
+    sensor_ref = {"@iot.id": sensor_ids['simulated']}
+    property_refs = {prop: {"@iot.id": prop_id} for prop, prop_id in property_ids.items()}
+    # Properties without an ObservedProperty id (reported by get_or_create_observed_properties) are skipped
+    node_props = [prop for prop in tools_sensorthings.EPANET_NODE_PROPERTIES if prop in property_refs]
     for node_data in nodes_data:
         node_id = node_data['id']
         node_type = node_data['type']
@@ -707,7 +718,7 @@ def _prepare_nodes_things_data(
 
         # Create Datastreams with Observations for each property
         datastreams = []
-        for prop in tools_sensorthings.EPANET_NODE_PROPERTIES:
+        for prop in node_props:
             prop_config = tools_sensorthings.EPANET_OBSERVED_PROPERTIES[prop]
             try:
                 if prop in results.node:
@@ -729,9 +740,9 @@ def _prepare_nodes_things_data(
                     "name": f"{prop_config['name']} at {node_id}",
                     "description": f"The {prop_config['name'].lower()} at EPANET {node_type} {node_id}",
                     "unitOfMeasurement": prop_config['unit'],
-                    "observationType": "http://www.opengis.net/def/observationType/OGC-OM/2.0/OM_Measurement",
-                    "Sensor": {"@iot.id": sensor_ids['simulated']},
-                    "ObservedProperty": {"@iot.id": property_ids[prop]},
+                    "observationType": tools_sensorthings.OM_MEASUREMENT,
+                    "Sensor": sensor_ref,
+                    "ObservedProperty": property_refs[prop],
                     "Observations": observations
                 }
                 datastreams.append(datastream)
@@ -780,6 +791,11 @@ def _prepare_links_things_data(
 ) -> List[Dict]:
     """Prepare Thing data for links (no HTTP calls)."""
     things_data = []
+    # Reference dicts shared by every Datastream body
+    sensor_ref = {"@iot.id": sensor_ids['simulated']}
+    property_refs = {prop: {"@iot.id": prop_id} for prop, prop_id in property_ids.items()}
+    # Properties without an ObservedProperty id (reported by get_or_create_observed_properties) are skipped
+    link_props = [prop for prop in tools_sensorthings.EPANET_LINK_PROPERTIES if prop in property_refs]
     for link_data in links_data:
         link_id = link_data['id']
         link_type = link_data['type']
@@ -796,7 +812,7 @@ def _prepare_links_things_data(
             transformed_vertices.append([lon, lat])
 
         datastreams = []
-        for prop in tools_sensorthings.EPANET_LINK_PROPERTIES:
+        for prop in link_props:
             prop_config = tools_sensorthings.EPANET_OBSERVED_PROPERTIES[prop]
             try:
                 if prop in results.link:
@@ -818,9 +834,9 @@ def _prepare_links_things_data(
                     "name": f"{prop_config['name']} at {link_id}",
                     "description": f"The {prop_config['name'].lower()} at EPANET {link_type} {link_id}",
                     "unitOfMeasurement": prop_config['unit'],
-                    "observationType": "http://www.opengis.net/def/observationType/OGC-OM/2.0/OM_Measurement",
-                    "Sensor": {"@iot.id": sensor_ids['simulated']},
-                    "ObservedProperty": {"@iot.id": property_ids[prop]},
+                    "observationType": tools_sensorthings.OM_MEASUREMENT,
+                    "Sensor": sensor_ref,
+                    "ObservedProperty": property_refs[prop],
                     "Observations": observations
                 }
                 datastreams.append(datastream)
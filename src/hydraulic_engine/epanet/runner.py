@@ -22,6 +22,12 @@ from .models import EpanetFeatureSettings, EpanetOptionsSettings, EpanetOtherSet
 from ..utils.tools_api import HeFrostClient
 from ..exceptions import HydraulicEngineError
 
+# Error prefix of runs whose INP file does not exist
+_FILE_NOT_FOUND = "File not found"
+
+# Lowercase markers of RPT lines reporting a run error or warning (see _parse_rpt_status)
+_RPT_STATUS_MARKERS = ("run was unsuccessful", "error:", "warning")
+
 
 @dataclass
 class EpanetRunResult:
@@ -128,6 +134,14 @@ class EpanetRunner:
         """
         result = EpanetRunResult()
 
+        # A missing INP file fails fast, before building handlers or raising through load_file
+        if not self.inp_path or not os.path.isfile(self.inp_path):
+            error_msg = f"{_FILE_NOT_FOUND}: {self.inp_path}"
+            result.status = RunStatus.ERROR
+            result.errors.append(error_msg)
+            tools_log.log_error(f"Failed to load INP file: {error_msg}")
+            return result
+
         self.inp = EpanetInpHandler()
         try:
             self.inp.load_file(self.inp_path)
@@ -369,6 +383,12 @@ class EpanetRunner:
             with open(result.rpt_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
 
+            # Most reports carry no status markers at all: check the whole text once before
+            # stripping and lowercasing it line by line
+            content_lower = content.lower()
+            if not any(marker in content_lower for marker in _RPT_STATUS_MARKERS):
+                return
+
             lines = content.split('\n')
 
             for line in lines:
@@ -5,6 +5,8 @@ General Public License as published by the Free Software Foundation, either vers
 or (at your option) any later version.
 """
 # -*- coding: utf-8 -*-
+import os
+
 from typing import Dict, List, Optional
 from datetime import datetime, timezone
 from pyproj import Transformer
@@ -94,9 +96,13 @@ class SwmmOutHandler(SwmmFileHandler, SwmmResultHandler):
             tools_log.log_error("No INP file loaded")
             return False
 
+        # INP path metadata, resolved once for the whole export
+        inp_file = inp_handler.file_path
+        inp_filename = os.path.basename(inp_file)
+
         # Pre-fetch existing entities (optimized: 2 API calls instead of N)
         tools_log.log_info("Fetching existing entities from server...")
-        things_cache = tools_sensorthings.get_all_things_with_locations(client)
+        things_cache = tools_sensorthings.get_all_things_with_locations(client, max_workers=max_workers)
         obs_props_cache = tools_sensorthings.get_all_observed_properties(client)
         tools_log.log_info(f"Found {len(things_cache)} existing Things and {len(obs_props_cache)} ObservedProperties")
 
@@ -111,8 +117,9 @@ class SwmmOutHandler(SwmmFileHandler, SwmmResultHandler):
         sensor_ids = tools_sensorthings.create_simulation_sensor(
             result_id=result_id,
             network_type='SWMM',
-            inp_file=inp_handler.file_path,
-            client=client
+            inp_file=inp_file,
+            client=client,
+            inp_filename=inp_filename
         )
 
         # Set up coordinate transformer
@@ -174,8 +181,9 @@ class SwmmOutHandler(SwmmFileHandler, SwmmResultHandler):
 def _prepare_nodes_data(inp_data: SwmmInput) -> List[Dict]:
     """Extract node data from SWMM input file."""
     nodes_data = []
+    node_type_index = tools_sensorthings.build_swmm_node_type_index(inp_data)
     for node_id, coordinates in inp_data['COORDINATES'].items():
-        node_type = tools_sensorthings.get_swmm_node_type(node_id, inp_data)
+        node_type = node_type_index.get(node_id, 'JUNCTION')
 
         nodes_data.append({
             'id': node_id,
@@ -193,6 +201,11 @@ def _prepare_nodes_things_data(
 ) -> List[Dict]:
     """Prepare Thing data for nodes (no HTTP calls)."""
     things_data = []
+    # Reference dicts shared by every Datastream body
+    sensor_ref = {"@iot.id": sensor_ids['simulated']}
+    property_refs = {prop: {"@iot.id": prop_id} for prop, prop_id in property_ids.items()}
+    # Properties without an ObservedProperty id (reported by get_or_create_observed_properties) are skipped
+    node_props = [prop for prop in tools_sensorthings.SWMM_NODE_PROPERTIES if prop in property_refs]
     for node_data in nodes_data:
         node_id = node_data['id']
         node_type = node_data['type']
@@ -207,7 +220,7 @@ def _prepare_nodes_things_data(
 
         # Create Datastreams with Observations for each property
         datastreams = []
-        for prop in tools_sensorthings.SWMM_NODE_PROPERTIES:
+        for prop in node_props:
             prop_config = tools_sensorthings.SWMM_OBSERVED_PROPERTIES[prop]
             try:
                 values = results.get_part('node', node_id, prop)
@@ -226,9 +239,9 @@ def _prepare_nodes_things_data(
                     "name": f"{prop_config['name']} at {node_id}",
                     "description": f"The {prop_config['name'].lower()} at SWMM {node_type} {node_id}",
                     "unitOfMeasurement": prop_config['unit'],
-                    "observationType": "http://www.opengis.net/def/observationType/OGC-OM/2.0/OM_Measurement",
-                    "Sensor": {"@iot.id": sensor_ids['simulated']},
-                    "ObservedProperty": {"@iot.id": property_ids[prop]},
+                    "observationType": tools_sensorthings.OM_MEASUREMENT,
+                    "Sensor": sensor_ref,
+                    "ObservedProperty": property_refs[prop],
                     "Observations": observations
                 }
                 datastreams.append(datastream)
@@ -258,13 +271,14 @@ def _prepare_nodes_things_data(
 def _prepare_links_data(inp_data: SwmmInput) -> List[Dict]:
     """Extract link data from SWMM input file."""
     links_data = []
+    link_type_index = tools_sensorthings.build_swmm_link_type_index(inp_data)
 
     # Process all link types
     link_types = ['CONDUITS', 'PUMPS', 'ORIFICES', 'WEIRS', 'OUTLETS']
     for link_section in link_types:
         if link_section in inp_data:
             for link_id in inp_data[link_section]:
-                link_type = tools_sensorthings.get_swmm_link_type(link_id, inp_data)
+                link_type = link_type_index.get(link_id, 'CONDUIT')
 
                 links_data.append({
                     'id': link_id,
@@ -281,6 +295,11 @@ def _prepare_links_things_data(
 ) -> List[Dict]:
     """Prepare Thing data for links (no HTTP calls)."""
     things_data = []
+    # Reference dicts shared by every Datastream body
+    sensor_ref = {"@iot.id": sensor_ids['simulated']}
+    property_refs = {prop: {"@iot.id": prop_id} for prop, prop_id in property_ids.items()}
+    # Properties without an ObservedProperty id (reported by get_or_create_observed_properties) are skipped
+    link_props = [prop for prop in tools_sensorthings.SWMM_LINK_PROPERTIES if prop in property_refs]
     for link_data in links_data:
         link_id = link_data['id']
         link_type = link_data['type']
@@ -297,7 +316,7 @@ def _prepare_links_things_data(
             transformed_vertices.append([lon, lat])
 
         datastreams = []
-        for prop in tools_sensorthings.SWMM_LINK_PROPERTIES:
+        for prop in link_props:
             prop_config = tools_sensorthings.SWMM_OBSERVED_PROPERTIES[prop]
             try:
                 values = results.get_part('link', link_id, prop)
@@ -316,9 +335,9 @@ def _prepare_links_things_data(
                     "name": f"{prop_config['name']} at {link_id}",
                     "description": f"The {prop_config['name'].lower()} at SWMM {link_type} {link_id}",
                     "unitOfMeasurement": prop_config['unit'],
-                    "observationType": "http://www.opengis.net/def/observationType/OGC-OM/2.0/OM_Measurement",
-                    "Sensor": {"@iot.id": sensor_ids['simulated']},
-                    "ObservedProperty": {"@iot.id": property_ids[prop]},
+                    "observationType": tools_sensorthings.OM_MEASUREMENT,
+                    "Sensor": sensor_ref,
+                    "ObservedProperty": property_refs[prop],
                     "Observations": observations
                 }
                 datastreams.append(datastream)
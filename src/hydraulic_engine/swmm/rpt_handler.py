@@ -5,7 +5,7 @@ General Public License as published by the Free Software Foundation, either vers
 or (at your option) any later version.
 """
 # -*- coding: utf-8 -*-
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .file_handler import SwmmResultHandler, SwmmFileHandler
 
@@ -26,6 +26,11 @@ class SwmmRptHandler(SwmmFileHandler, SwmmResultHandler):
         summary = handler.get_summary()
     """
 
+    def __init__(self):
+        super().__init__()
+        # (file_path, file_object) the cached summary was built from, and the summary itself
+        self._summary_cache: Optional[Tuple[Tuple[Optional[str], Any], Dict[str, Any]]] = None
+
     def export_to_database(self) -> bool:
         pass  #TODO: Implement export to database
 
@@ -222,9 +227,17 @@ class SwmmRptHandler(SwmmFileHandler, SwmmResultHandler):
     def get_summary(self) -> Dict[str, Any]:
         """
         Get a summary of the RPT file contents.
+        The summary is built once per loaded file (it reads the report several times) and
+        rebuilt when a different file is loaded.
         
         :return: Dictionary with summary information
         """
+        key = (self.file_path, self.file_object)
+        if self._summary_cache is not None:
+            cached_key, cached_summary = self._summary_cache
+            if cached_key[0] == key[0] and cached_key[1] is key[1]:
+                return dict(cached_summary)
+
         summary = {
             "file": self.file_path,
             "loaded": self.is_loaded(),
@@ -235,7 +248,8 @@ class SwmmRptHandler(SwmmFileHandler, SwmmResultHandler):
             "has_link_flow_summary": self.get_link_flow_summary() is not None,
             "has_subcatchment_runoff_summary": self.get_subcatchment_runoff_summary() is not None,
         }
-        return summary
+        self._summary_cache = (key, summary)
+        return dict(summary)
 
     # =========================================================================
     # Raw RPT Access
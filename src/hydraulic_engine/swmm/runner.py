@@ -6,6 +6,7 @@ or (at your option) any later version.
 """
 # -*- coding: utf-8 -*-
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from dataclasses import dataclass, field
 from typing import Any, List, Optional, Callable
@@ -21,6 +22,12 @@ from ..utils import tools_log
 from ..utils.tools_api import HeFrostClient
 from ..exceptions import HydraulicEngineError
 
+# Error prefix of runs whose INP file does not exist
+_FILE_NOT_FOUND = "File not found"
+
+# Lowercase markers of RPT lines reporting a run error or warning (see _parse_rpt_status)
+_RPT_STATUS_MARKERS = ("run was unsuccessful", "error:", "warning")
+
 
 @dataclass
 class SwmmRunResult:
@@ -128,6 +135,14 @@ class SwmmRunner:
         """
         result = SwmmRunResult()
 
+        # A missing INP file fails fast, before building handlers or raising through load_file
+        if not self.inp_path or not os.path.isfile(self.inp_path):
+            error_msg = f"{_FILE_NOT_FOUND}: {self.inp_path}"
+            result.status = RunStatus.ERROR
+            result.errors.append(error_msg)
+            tools_log.log_error(f"Failed to load INP file: {error_msg}")
+            return result
+
         self.inp = SwmmInpHandler()
         try:
             self.inp.load_file(self.inp_path)
@@ -207,14 +222,18 @@ class SwmmRunner:
                 # Step through simulation
                 for step in sim:
                     step_count += 1
-                    percent = sim.percent_complete
-
-                    # Map 0.0-1.0 to 15-100% progress range
-                    sim_progress = min(100, int(15 + percent * 85))
 
-                    # Only report every 0.5 seconds to avoid flooding
+                    # Only report every 0.5 seconds to avoid flooding; the engine's percent_complete
+                    # is only queried once that interval has elapsed, not on every routing step
                     current_real_time = time.time()
-                    if sim_progress != last_progress and (current_real_time - last_report_time) >= 0.5:
+                    if self._progress_callback and (current_real_time - last_report_time) >= 0.5:
+                        percent = sim.percent_complete
+                        # Map 0.0-1.0 to 15-100% progress range
+                        sim_progress = min(100, int(15 + percent * 85))
+                    else:
+                        sim_progress = last_progress
+
+                    if sim_progress != last_progress:
                         # Calculate ETA based on average step duration
                         elapsed_real = current_real_time - real_start_time
                         if percent > 0:
@@ -249,20 +268,26 @@ class SwmmRunner:
 
             self._report_progress(90, "Simulation completed, checking results...")
 
-            # Check if output files were created
-            if os.path.isfile(result.rpt_path):
-                # Parse RPT for errors/warnings
-                self._parse_rpt_status(result)
-                self.rpt.load_file(result.rpt_path)
-            else:
-                result.status = RunStatus.ERROR
-                result.errors.append("RPT file was not created")
-
-            if os.path.isfile(result.out_path):
-                self.out.load_file(result.out_path)
-            else:
-                result.status = RunStatus.ERROR
-                result.errors.append("OUT file was not created")
+            # Check if output files were created. The binary OUT file is loaded in a worker
+            # thread so its (mostly I/O) read overlaps with scanning and loading the RPT file
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                out_future = None
+                if os.path.isfile(result.out_path):
+                    out_future = executor.submit(self.out.load_file, result.out_path)
+
+                if os.path.isfile(result.rpt_path):
+                    # Parse RPT for errors/warnings
+                    self._parse_rpt_status(result)
+                    self.rpt.load_file(result.rpt_path)
+                else:
+                    result.status = RunStatus.ERROR
+                    result.errors.append("RPT file was not created")
+
+                if out_future is not None:
+                    out_future.result()
+                else:
+                    result.status = RunStatus.ERROR
+                    result.errors.append("OUT file was not created")
 
             result.duration_seconds = time.time() - start_time
 
@@ -304,6 +329,12 @@ class SwmmRunner:
             with open(result.rpt_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
 
+            # Most reports carry no status markers at all: check the whole text once before
+            # stripping and lowercasing it line by line
+            content_lower = content.lower()
+            if not any(marker in content_lower for marker in _RPT_STATUS_MARKERS):
+                return
+
             lines = content.split('\n')
 
             for line in lines:
@@ -10,7 +10,7 @@ Utils module - Contains utility functions for hydraulic calculations.
 from .enums import ExportDataSource, RunStatus
 from .tools_db import HeDbDao, HePgDao, HeSqliteDao, HeGpkgDao, DbType
 from .tools_db import create_pg_connection, create_gpkg_connection, create_sqlite_connection
-from .tools_db import get_connection, close_connection
+from .tools_db import get_connection, close_connection, clear_sqlite_pool, clear_pg_pool
 from .tools_api import HeApiClient, HeFrostClient, ApiType
 from .tools_api import create_frost_connection, get_api_client, close_api_client
 from .tools_log import set_logger, log_debug, log_info, log_warning, log_error, HeLogger
@@ -29,6 +29,8 @@ __all__ = [
     "create_sqlite_connection",
     "get_connection",
     "close_connection",
+    "clear_sqlite_pool",
+    "clear_pg_pool",
     "HeApiClient",
     "HeFrostClient",
     "ApiType",
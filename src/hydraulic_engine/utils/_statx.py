@@ -0,0 +1,77 @@
+"""
+Copyright © 2026 by BGEO. All rights reserved.
+The program is free software: you can redistribute it and/or modify it under the terms of the GNU
+General Public License as published by the Free Software Foundation, either version 3 of the License,
+or (at your option) any later version.
+
+Minimal ctypes binding to Linux statx(2), used to query only the file type bits
+without forcing attribute synchronisation on network filesystems.
+"""
+# -*- coding: utf-8 -*-
+import ctypes
+import os
+import stat
+import sys
+from typing import Optional
+
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x0001
+
+
+class _Statx(ctypes.Structure):
+    """Leading fields of struct statx (padded to the kernel's 256-byte size)"""
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_reserved", ctypes.c_uint8 * 226),
+    ]
+
+
+def _load_statx() -> Optional[object]:
+    """Return libc's statx function if it is usable on this system, else None (probed once at import)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        func = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):
+        # glibc < 2.28 or non-glibc libc without the wrapper
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(_Statx)]
+    func.restype = ctypes.c_int
+    buf = _Statx()
+    if func(AT_FDCWD, b"/", AT_STATX_DONT_SYNC, STATX_TYPE, ctypes.byref(buf)) != 0:
+        # Kernel < 4.11 (ENOSYS) or blocked by a seccomp filter
+        return None
+    return func
+
+
+_statx = _load_statx()
+HAS_STATX = _statx is not None
+
+
+def get_file_type(path: str) -> int:
+    """
+    Get the file type bits of a path with statx(AT_STATX_DONT_SYNC, STATX_TYPE).
+    Falls back to os.stat when statx is not available.
+
+    :param path: Path to check
+    :return: stat.S_IFMT of the path's mode, or 0 if it does not exist
+    """
+    try:
+        if _statx is None:
+            return stat.S_IFMT(os.stat(path).st_mode)
+        encoded = os.fsencode(path)
+        if b"\0" in encoded:
+            return 0
+        buf = _Statx()
+        if _statx(AT_FDCWD, encoded, AT_STATX_DONT_SYNC, STATX_TYPE, ctypes.byref(buf)) != 0:
+            return 0
+        return stat.S_IFMT(buf.stx_mode)
+    except (OSError, ValueError):
+        return 0
@@ -8,7 +8,7 @@ or (at your option) any later version.
 from enum import Enum
 
 
-class RunStatus(Enum):
+class RunStatus(str, Enum):
     """Simulation run status"""
     SUCCESS = "success"
     WARNING = "warning"
@@ -16,7 +16,7 @@ class RunStatus(Enum):
     NOT_RUN = "not_run"
 
 
-class ExportDataSource(Enum):
+class ExportDataSource(str, Enum):
     """Export data source"""
     DATABASE = "database"
     FROST = "frost"
\ No newline at end of file
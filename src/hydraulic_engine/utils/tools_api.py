@@ -6,17 +6,41 @@ or (at your option) any later version.
 """
 # -*- coding: utf-8 -*-
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sized, Tuple
 from enum import Enum
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
 
 from . import tools_log
 
 
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _json_dumps(data) -> bytes:
+        """Serialize a request body to UTF-8 JSON bytes"""
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(data) -> bytes:
+        """Serialize a request body to UTF-8 JSON bytes"""
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    _json_loads = json.loads
+
+
 class ApiType(Enum):
     """API type enumeration"""
     FROST = "frost"  # SensorThings API (FROST-Server)
@@ -114,21 +138,33 @@ class HeFrostClient(HeApiClient):
         keycloak_realm: Optional[str] = None,
         keycloak_client_id: Optional[str] = None,
         keycloak_client_secret: Optional[str] = None,
+        pool_maxsize: int = 16,
         **kwargs
     ) -> bool:
         """
         Configure FROST-Server connection with optional Keycloak authentication.
+        A single session with a pooled adapter is shared by all requests, including
+        the concurrent batch and pagination workers, so connections are kept alive.
 
         :param base_url: Base URL of FROST-Server (e.g., "http://localhost:8080/FROST-Server/v1.1/")
         :param keycloak_url: Keycloak server URL (optional)
         :param keycloak_realm: Keycloak realm (optional)
         :param keycloak_client_id: Keycloak client ID (optional)
         :param keycloak_client_secret: Keycloak client secret (optional)
+        :param pool_maxsize: Maximum kept-alive connections per host, should be >= max_workers used
         :return: True if configuration successful
         """
         try:
             self.base_url = base_url.rstrip('/') + '/'
             self.session = requests.Session()
+            # Retries only apply to idempotent methods, batch POSTs are never replayed
+            adapter = HTTPAdapter(
+                pool_connections=pool_maxsize,
+                pool_maxsize=pool_maxsize,
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+            )
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
 
             # Configure Keycloak authentication if all parameters provided
             if all([keycloak_url, keycloak_realm, keycloak_client_id, keycloak_client_secret]):
@@ -183,14 +219,14 @@ class HeFrostClient(HeApiClient):
     def post(self, endpoint: str, data: Dict) -> requests.Response:
         """Send POST request to endpoint."""
         url = f'{self.base_url}{endpoint}'
-        response = self.session.post(url, json=data, headers=self._get_headers())
+        response = self.session.post(url, data=_json_dumps(data), headers=self._get_headers())
         response.raise_for_status()
         return response
 
     def patch(self, endpoint: str, data: Dict) -> requests.Response:
         """Send PATCH request to endpoint."""
         url = f'{self.base_url}{endpoint}'
-        response = self.session.patch(url, json=data, headers=self._get_headers())
+        response = self.session.patch(url, data=_json_dumps(data), headers=self._get_headers())
         response.raise_for_status()
         return response
 
@@ -233,17 +269,51 @@ class HeFrostClient(HeApiClient):
             return False
 
     def get_entities(self, entity_type: str, expand: Optional[str] = None,
-                     top: int = 1000) -> Optional[List[Dict]]:
-        """Get all entities with pagination support."""
+                     top: int = 1000, select: Optional[str] = None,
+                     max_workers: int = 1) -> Optional[List[Dict]]:
+        """
+        Get all entities with pagination support.
+        With max_workers > 1 the total is requested with $count and the remaining pages
+        are fetched concurrently with $skip instead of following @iot.nextLink one by one.
+
+        :param entity_type: Entity set to fetch (e.g. "Things")
+        :param expand: $expand option, may carry nested options (e.g. "Locations($select=location)")
+        :param top: Page size
+        :param select: $select option to only fetch the given properties (e.g. "@iot.id,name")
+        :param max_workers: Number of concurrent page requests (default: 1, sequential)
+        :return: List of entity dicts or None on error
+        """
         try:
-            entities = []
-            endpoint = f'{entity_type}?$top={top}'
+            options = ''
+            if select:
+                options += f'&$select={select}'
             if expand:
-                endpoint += f'&$expand={expand}'
+                options += f'&$expand={expand}'
+
+            if max_workers > 1:
+                # Stable order is required for $skip paging
+                options += '&$orderby=id'
+                data = self._get_json(f'{entity_type}?$top={top}&$count=true{options}')
+                entities = data.get('value', [])
+                total = data.get('@iot.count')
+                page_size = len(entities)
+                if data.get('@iot.nextLink') and total is not None and page_size:
+                    # The server may cap $top, so page with the size it actually returned
+                    endpoints = [
+                        f'{entity_type}?$top={page_size}&$skip={skip}{options}'
+                        for skip in range(page_size, total, page_size)
+                    ]
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        for page in executor.map(self._get_json, endpoints):
+                            entities.extend(page.get('value', []))
+                    return entities
+                endpoint = data.get('@iot.nextLink')
+            else:
+                entities = []
+                endpoint = f'{entity_type}?$top={top}{options}'
 
             while endpoint:
-                response = self.get(endpoint)
-                data = response.json()
+                data = self._get_json(endpoint)
 
                 if 'value' in data:
                     entities.extend(data['value'])
@@ -263,6 +333,10 @@ class HeFrostClient(HeApiClient):
             tools_log.log_error(f"Error getting {entity_type}: {e}")
             return None
 
+    def _get_json(self, endpoint: str) -> Dict:
+        """Send GET request to endpoint and decode the JSON response."""
+        return _json_loads(self.get(endpoint).content)
+
     def _send_single_batch(self, batch: List[Dict], batch_num: int) -> Tuple[int, List[Dict], float]:
         """
         Send a single batch request. Used by ThreadPoolExecutor.
@@ -272,79 +346,88 @@ class HeFrostClient(HeApiClient):
         """
         batch_start = time.time()
         response = self.post('$batch', {"requests": batch})
-        responses = response.json().get('responses', [])
+        responses = _json_loads(response.content).get('responses', [])
         elapsed = time.time() - batch_start
         return batch_num, responses, elapsed
 
-    def batch_request(self, batch_requests: List[Dict],
+    def batch_request(self, batch_requests: Iterable[Dict],
                       batch_size: int = 50, max_workers: int = 4) -> Optional[List[Dict]]:
         """
         Send multiple operations in a single HTTP request using FROST-Server's JSON Batch Request.
         Splits into multiple batches and sends them concurrently for better performance.
+        Requests are consumed lazily, so a generator can be passed to overlap request preparation
+        with sending while only keeping a few batches in memory.
 
-        :param batch_requests: List of request dicts with 'id', 'method', 'url', and optionally 'body'
+        :param batch_requests: Iterable of request dicts with 'id', 'method', 'url', and optionally 'body'
         :param batch_size: Maximum number of operations per batch request
         :param max_workers: Number of concurrent batch requests (default: 4)
         :return: List of response dicts from all batches
         """
         try:
-            total_requests = len(batch_requests)
-            num_batches = (total_requests + batch_size - 1) // batch_size
+            if isinstance(batch_requests, Sized):
+                total_requests = len(batch_requests)
+                num_batches = (total_requests + batch_size - 1) // batch_size
+            else:
+                total_requests = num_batches = '?'
 
-            # Split into batches
-            batches = []
-            for i in range(0, total_requests, batch_size):
-                batches.append(batch_requests[i:i + batch_size])
+            # Lazily split into batches, an empty list ends the iteration
+            requests_iter = iter(batch_requests)
+            batches = iter(lambda: list(islice(requests_iter, batch_size)), [])
+            max_pending = max_workers * 2
 
             # Track results by batch number to maintain order
             results_by_batch = {}
             total_success = 0
             total_failed = 0
             completed = 0
-
-            # Thread-safe counter for progress
-            lock = threading.Lock()
+            ops_done = 0
 
             total_start = time.time()
 
             tools_log.log_info(f"  Sending {num_batches} batches with {max_workers} concurrent workers...")
 
+            def collect(future):
+                nonlocal total_success, total_failed, completed, ops_done
+                batch_num, responses, batch_time = future.result()
+                results_by_batch[batch_num] = responses
+
+                # Count successes/failures
+                success = sum(1 for r in responses if 200 <= r.get('status', 0) < 300)
+                failed = len(responses) - success
+
+                completed += 1
+                total_success += success
+                total_failed += failed
+                ops_done += len(responses)
+                elapsed = time.time() - total_start
+
+                tools_log.log_info(
+                    f"  Batch {batch_num}/{num_batches}: {len(responses)} ops in {batch_time:.2f}s "
+                    f"({success} ok, {failed} err) - Progress: {completed}/{num_batches} batches, "
+                    f"{ops_done}/{total_requests} ops ({elapsed:.1f}s)"
+                )
+
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all batches
-                futures = {
-                    executor.submit(self._send_single_batch, batch, batch_num): batch_num
-                    for batch_num, batch in enumerate(batches, 1)
-                }
-
-                # Process results as they complete
-                for future in as_completed(futures):
-                    batch_num, responses, batch_time = future.result()
-                    results_by_batch[batch_num] = responses
-
-                    # Count successes/failures
-                    success = sum(1 for r in responses if 200 <= r.get('status', 0) < 300)
-                    failed = len(responses) - success
-
-                    with lock:
-                        completed += 1
-                        total_success += success
-                        total_failed += failed
-                        elapsed = time.time() - total_start
-                        ops_done = sum(len(r) for r in results_by_batch.values())
-
-                        tools_log.log_info(
-                            f"  Batch {batch_num}/{num_batches}: {len(responses)} ops in {batch_time:.2f}s "
-                            f"({success} ok, {failed} err) - Progress: {completed}/{num_batches} batches, "
-                            f"{ops_done}/{total_requests} ops ({elapsed:.1f}s)"
-                        )
+                # Submit batches as they are built, keeping a bounded number in flight
+                pending = set()
+                for batch_num, batch in enumerate(batches, 1):
+                    if len(pending) >= max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            collect(future)
+                    pending.add(executor.submit(self._send_single_batch, batch, batch_num))
+
+                # Process the remaining results as they complete
+                for future in as_completed(pending):
+                    collect(future)
 
             # Reassemble responses in original order
             all_responses = []
-            for batch_num in range(1, num_batches + 1):
+            for batch_num in range(1, len(results_by_batch) + 1):
                 all_responses.extend(results_by_batch[batch_num])
 
             total_time = time.time() - total_start
-            ops_per_sec = total_requests / total_time if total_time > 0 else 0
+            ops_per_sec = ops_done / total_time if total_time > 0 else 0
             tools_log.log_info(
                 f"  All batches complete: {total_success} ok, {total_failed} err in "
                 f"{total_time:.2f}s ({ops_per_sec:.1f} ops/sec)"
@@ -5,22 +5,212 @@ General Public License as published by the Free Software Foundation, either vers
 or (at your option) any later version.
 """
 # -*- coding: utf-8 -*-
+import os
+import queue
+import re
 import sqlite3
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.request import pathname2url
 from abc import ABC, abstractmethod
 from enum import Enum
 
-try:
-    import psycopg
-    from psycopg.rows import dict_row, tuple_row
-    PSYCOPG_AVAILABLE = True
-except ImportError:
-    PSYCOPG_AVAILABLE = False
-
 from . import tools_log
+from .tools_os import PathType
+
+# psycopg is imported on first use (see _get_psycopg) so SQLite/GeoPackage users never load libpq
+_psycopg = None
+
+
+# libpq connection defaults to detect dead PostgreSQL connections in seconds (overridable via kwargs)
+_PG_CONNINFO_DEFAULTS = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "tcp_user_timeout": 30000,
+}
+
+# SQLite default SQLITE_MAX_VARIABLE_NUMBER (bound parameters per statement)
+_SQLITE_MAX_VARIABLES = 999
+
+# Idle SQLite connections kept open per absolute database path (see HeSqliteDao pool_size)
+_SQLITE_POOL: Dict[str, "queue.LifoQueue[sqlite3.Connection]"] = {}
+
+# Idle PostgreSQL connections (with their connect time) kept open per conninfo (see HePgDao pool_size)
+_PG_POOL: Dict[str, "queue.LifoQueue[Tuple[Any, float]]"] = {}
+
+# Guards creation and clearing of the per-database queues of both pools
+_POOL_LOCK = threading.Lock()
+
+# SQL templates and patterns, built once at import
+# Plain "INSERT ... VALUES (?, ?, ...)" with VALUES as the last clause, no literals, quoting or other
+# parameters before it, and only anonymous '?' placeholders (see HeSqliteDao.execute_many)
+_INSERT_VALUES_RE = re.compile(
+    r"\s*INSERT\s[^'\"`\[?:@$;]+?\sVALUES\s*(\(\s*\?(?:\s*,\s*\?)*\s*\))\s*;?\s*$",
+    re.I
+)
+
+_SQLITE_PRAGMAS_SQL = (
+    "PRAGMA foreign_keys = ON;"
+    "PRAGMA cache_size = -65536;"
+    "PRAGMA temp_store = MEMORY;"
+)
+
+# Applied on top of _SQLITE_PRAGMAS_SQL in fast mode (opt-in): WAL journaling (readers don't block the
+# writer), relaxed fsync and memory-mapped reads. WAL is persistent in the database file and needs the
+# -wal/-shm side files, which GeoPackage readers and read-only/network locations may not support
+_SQLITE_FAST_PRAGMAS_SQL = (
+    "PRAGMA journal_mode = WAL;"
+    "PRAGMA synchronous = NORMAL;"
+    "PRAGMA mmap_size = 268435456;"
+)
+
+_LIST_TABLES_SQL = (
+    "SELECT name FROM sqlite_master "
+    "WHERE type='table' AND name NOT LIKE 'gpkg_%' AND name NOT LIKE 'sqlite_%'"
+)
+
+_GEOM_TABLES_SQL = (
+    "SELECT table_name, data_type, identifier, description, srs_id "
+    "FROM gpkg_contents "
+    "WHERE data_type IN ('features', 'tiles')"
+)
+
+
+def _get_psycopg():
+    """
+    Import psycopg on first use and memoize the module.
+
+    :return: psycopg module
+    :raises ImportError: If psycopg is not installed
+    """
+    global _psycopg
+    if _psycopg is None:
+        try:
+            import psycopg
+        except ImportError as e:
+            raise ImportError("psycopg3 is not installed. Install with: pip install psycopg[binary]") from e
+        _psycopg = psycopg
+    return _psycopg
+
+
+# Literals, quoted identifiers and dollar-quoted bodies are kept verbatim; runs of comments and
+# whitespace collapse to a single space, or a single newline if they span lines (PostgreSQL only
+# concatenates adjacent string literals separated by a newline)
+_SQL_TOKEN_RE = re.compile(
+    r"((?<![\w$])[eE]'(?:[^'\\]|\\.|'')*')"
+    r"|('(?:[^']|'')*')"
+    r'|("(?:[^"]|"")*")'
+    r"|(\$((?:[A-Za-z_]\w*)?)\$.*?\$\5\$)"
+    r"|((?:--[^\n]*|/\*.*?\*/|\s+)+)",
+    re.S
+)
+
+
+def _normalize_sql_token(match: "re.Match") -> str:
+    separator = match.group(6)
+    if separator is None:
+        return match.group(0)
+    return "\n" if "\n" in separator else " "
+
+
+@lru_cache(maxsize=1024)
+def _normalize_sql_text(sql: str) -> str:
+    return _SQL_TOKEN_RE.sub(_normalize_sql_token, sql).strip()
+
+
+def _normalize_sql(sql: Any) -> Any:
+    """
+    Normalize a SQL statement so that equivalent statements share the same text.
+    psycopg identifies prepared statements by exact text, so collapsing whitespace and
+    stripping comments lets generated SQL hit the prepared-statement cache.
+
+    :param sql: SQL statement; anything other than str (e.g. psycopg.sql.Composable) is returned as is
+    :return: Normalized SQL statement
+    """
+    if not isinstance(sql, str):
+        return sql
+    return _normalize_sql_text(sql)
+
+
+def _sqlite_pool_key(db_path: str, db_type: "DbType", fast_mode: bool) -> Optional[str]:
+    """
+    Return the pool key of a SQLite database, or None if it can't be pooled (in-memory databases).
+    Connections are only shared between DAOs of the same type opened with the same fast_mode,
+    since both decide how a new connection is configured.
+    """
+    if db_path == ":memory:" or db_path.startswith("file:"):
+        return None
+    return f"{os.path.abspath(db_path)}|{db_type.value}|fast_mode={int(fast_mode)}"
+
+
+def _sqlite_read_only_uri(db_path: str) -> str:
+    """Return a read-only URI for a SQLite database file (db_path unchanged for in-memory databases and URIs)."""
+    if db_path == ":memory:" or db_path.startswith("file:"):
+        return db_path
+    return f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro"
+
+
+def _pool_checkout(pools: Dict[str, "queue.LifoQueue"], key: str) -> Optional[Any]:
+    """Take an idle item from the pool of a database, if any."""
+    with _POOL_LOCK:
+        pool = pools.get(key)
+    if pool is None:
+        return None
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        return None
+
+
+def _pool_checkin(pools: Dict[str, "queue.LifoQueue"], key: str, item: Any, pool_size: int) -> bool:
+    """Return an item to the pool of a database. False if the pool is full."""
+    with _POOL_LOCK:
+        pool = pools.get(key)
+        if pool is None:
+            pool = pools[key] = queue.LifoQueue(maxsize=pool_size)
+    try:
+        pool.put_nowait(item)
+        return True
+    except queue.Full:
+        return False
+
+
+def _pool_drain(pools: Dict[str, "queue.LifoQueue"]) -> List[Any]:
+    """Empty every pool and return the idle items that were in them."""
+    with _POOL_LOCK:
+        queues = list(pools.values())
+        pools.clear()
+    items = []
+    for pool in queues:
+        while True:
+            try:
+                items.append(pool.get_nowait())
+            except queue.Empty:
+                break
+    return items
+
+
+def clear_sqlite_pool() -> None:
+    """Close every idle pooled SQLite connection."""
+    for conn in _pool_drain(_SQLITE_POOL):
+        conn.close()
+
+
+def clear_pg_pool() -> None:
+    """Close every idle pooled PostgreSQL connection."""
+    for conn, _ in _pool_drain(_PG_POOL):
+        try:
+            conn.close()
+        except Exception:
+            pass
 
 
-class DbType(Enum):
+class DbType(str, Enum):
     """Database type enumeration"""
     POSTGRESQL = "postgresql"
     SQLITE = "sqlite"
@@ -112,13 +302,19 @@ class HeDbDao(ABC):
             self.last_error = str(e)
             tools_log.log_error(f"Rollback error: {e}")
 
-    def is_connected(self) -> bool:
+    def is_connected(self, probe: bool = False) -> bool:
         """
         Check if database is connected.
+        By default only checks that a connection is open, without a round-trip to the database.
 
+        :param probe: Also run a trivial query to verify the connection is alive
         :return: True if connected
         """
-        return self.conn is not None
+        if self.conn is None:
+            return False
+        if not probe:
+            return True
+        return self.get_row("SELECT 1") is not None
 
     @abstractmethod
     def clone(self) -> "HeDbDao":
@@ -135,10 +331,33 @@ class HePgDao(HeDbDao):
     PostgreSQL Database Access Object using psycopg3.
     """
 
-    def __init__(self):
+    def __init__(self, pre_ping: bool = False, pool_recycle: Optional[int] = 1800, pool_size: int = 0):
+        """
+        :param pre_ping: Check the connection with a lightweight 'SELECT 1' before each statement
+            and reconnect if it is dead (default False, it costs one round-trip per statement)
+        :param pool_recycle: Reconnect when the connection is older than this many seconds
+            (None or 0 to disable)
+        :param pool_size: Number of idle connections to keep open per database on close_db, so that
+            the next connect (or clone) with the same parameters reuses one instead of paying the
+            TCP/TLS handshake and backend startup again (default 0, no pooling)
+
+        Both checks only run while no transaction is open: when a pooled connection is checked out,
+        right after commit()/rollback(), and before a statement issued outside a transaction. With
+        autocommit off, any query (even a SELECT) opens a transaction that lasts until the next
+        commit/rollback, so a DAO that only reads and never commits is not checked again. A connection
+        that breaks while a transaction is open is not replaced behind the caller's back: statements
+        fail until rollback() is called, which reconnects.
+        """
         super().__init__()
         self.db_type = DbType.POSTGRESQL
         self._connection_params: Dict[str, Any] = {}
+        self.pre_ping = pre_ping
+        self.pool_recycle = pool_recycle
+        self.pool_size = pool_size
+        self._pool_key: Optional[str] = None
+        self._connected_at = 0.0
+        # Statements have run on this connection since the last commit/rollback
+        self._transaction_open = False
 
     def connect(
         self,
@@ -161,8 +380,10 @@ class HePgDao(HeDbDao):
         :param schema: Default schema (optional)
         :return: True if connection successful
         """
-        if not PSYCOPG_AVAILABLE:
-            self.last_error = "psycopg3 is not installed. Install with: pip install psycopg[binary]"
+        try:
+            psycopg = _get_psycopg()
+        except ImportError as e:
+            self.last_error = str(e)
             tools_log.log_error(self.last_error)
             return False
 
@@ -178,20 +399,36 @@ class HePgDao(HeDbDao):
                 **kwargs
             }
 
-            # Build connection string
-            conninfo = f"host={host} port={port} dbname={dbname} user={user} password={password}"
-
-            # Add any additional parameters
-            for key, value in kwargs.items():
-                if key not in ("host", "port", "dbname", "user", "password", "schema"):
-                    conninfo += f" {key}={value}"
+            # Build connection string (libpq quoting/escaping), with TCP keepalive defaults
+            conninfo_params = _PG_CONNINFO_DEFAULTS | self._connection_params
+            conninfo = psycopg.conninfo.make_conninfo(**{
+                key: value for key, value in conninfo_params.items()
+                if key != "schema" and value is not None and value != ""
+            })
+
+            # The search_path is per session, so pooled connections are keyed by schema too
+            self._pool_key = f"{conninfo} schema={schema or ''}" if self.pool_size > 0 else None
+            pooled = self._pool_checkout() if self._pool_key else None
+            self._transaction_open = False
+            if pooled is not None:
+                self.conn, self._connected_at = pooled
+                self.cursor = self.conn.cursor()
+                tools_log.log_info(f"Reusing pooled PostgreSQL connection: {dbname}@{host}:{port}")
+                return True
 
             self.conn = psycopg.connect(conninfo, autocommit=False)
             self.cursor = self.conn.cursor()
-
-            # Set search_path if schema is provided
-            if schema:
-                self.execute(f"SET search_path TO {schema}, public", commit=False)
+            self._connected_at = time.monotonic()
+
+            # Set search_path if schema is provided. Committed right away: a SET left in an open
+            # transaction is undone by the next rollback (e.g. on pool checkin), and the pooled
+            # connection would be handed out for this schema with the default search_path
+            if schema and not self.execute(f"SET search_path TO {schema}, public"):
+                error = self.last_error
+                self._pool_key = None
+                self.close_db()
+                self.last_error = error
+                return False
 
             tools_log.log_info(f"Connected to PostgreSQL database: {dbname}@{host}:{port}")
             return True
@@ -202,19 +439,117 @@ class HePgDao(HeDbDao):
             return False
 
     def close_db(self) -> None:
-        """Close the database connection."""
+        """Close the database connection (or return it to the pool, see pool_size)."""
         try:
             if self.cursor:
                 self.cursor.close()
                 self.cursor = None
             if self.conn:
-                self.conn.close()
+                if not self._pool_key or not self._pool_checkin():
+                    self.conn.close()
                 self.conn = None
             tools_log.log_info("PostgreSQL connection closed")
         except Exception as e:
             self.last_error = str(e)
             tools_log.log_error(f"Error closing PostgreSQL connection: {e}")
 
+    def _pool_checkout(self) -> Optional[Tuple[Any, float]]:
+        """
+        Take a usable idle connection from the pool, closing any broken or expired ones found.
+
+        :return: (connection, connect time) or None if the pool has none
+        """
+        while True:
+            pooled = _pool_checkout(_PG_POOL, self._pool_key)
+            if pooled is None:
+                return None
+            conn, connected_at = pooled
+            expired = self.pool_recycle and time.monotonic() - connected_at > self.pool_recycle
+            if not conn.closed and not conn.broken and not expired:
+                return pooled
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _pool_checkin(self) -> bool:
+        """
+        Return the connection to the pool, rolling back any open transaction first.
+
+        :return: False if the connection can't be pooled (broken or pool full) and must be closed
+        """
+        if self.conn.closed or self.conn.broken:
+            return False
+        psycopg = _get_psycopg()
+        if self.conn.info.transaction_status != psycopg.pq.TransactionStatus.IDLE:
+            # Never hand an open transaction to the next user of the connection
+            self.conn.rollback()
+        return _pool_checkin(_PG_POOL, self._pool_key, (self.conn, self._connected_at), self.pool_size)
+
+    def commit(self) -> bool:
+        """
+        Commit the current transaction, then recycle the connection if due (see pool_recycle).
+
+        :return: True if commit successful
+        """
+        result = super().commit()
+        self._transaction_open = False
+        if self.conn and (self.pre_ping or self.pool_recycle):
+            self._check_connection(ping=False)
+        return result
+
+    def rollback(self) -> None:
+        """Rollback the current transaction, then recycle the connection if due (see pool_recycle)."""
+        super().rollback()
+        self._transaction_open = False
+        if self.conn and (self.pre_ping or self.pool_recycle):
+            self._check_connection(ping=False)
+
+    def _check_connection(self, ping: bool = True) -> None:
+        """
+        Recycle or pre-ping the connection (see pool_recycle and pre_ping).
+        Only done with no open transaction, so pending work is never dropped. A broken connection
+        is rebuilt if no statement ran on it since the last commit/rollback; otherwise the
+        transaction's uncommitted statements are lost, so the check fails instead of silently
+        running the next statement in a new transaction (roll back to reconnect).
+
+        :param ping: Also run the pre_ping query if enabled
+        :raises psycopg.OperationalError: If the connection broke with a transaction open
+        """
+        psycopg = _get_psycopg()
+        if self.conn.broken:
+            if self._transaction_open:
+                raise psycopg.OperationalError(
+                    "PostgreSQL connection lost with a transaction open, its uncommitted statements are lost"
+                )
+            tools_log.log_warning("PostgreSQL connection lost, reconnecting")
+        elif self.conn.info.transaction_status != psycopg.pq.TransactionStatus.IDLE:
+            return
+        elif self.pool_recycle and time.monotonic() - self._connected_at > self.pool_recycle:
+            tools_log.log_info("Recycling PostgreSQL connection")
+        elif self.pre_ping and ping:
+            try:
+                self.conn.execute("SELECT 1")
+                # End the transaction opened by the ping so the next check still sees an idle connection
+                self.conn.rollback()
+                return
+            except psycopg.OperationalError as e:
+                tools_log.log_warning(f"PostgreSQL connection lost, reconnecting: {e}")
+        else:
+            return
+        self._reconnect()
+
+    def _reconnect(self) -> None:
+        """Rebuild the connection with the stored connection parameters."""
+        # The connection is being replaced because it is dead or too old: close it, never pool it
+        self._pool_key = None
+        try:
+            self.close_db()
+        finally:
+            self.conn = None
+            self.cursor = None
+        self.connect(**self._connection_params)
+
     def execute(self, sql: str, params: Optional[tuple] = None, commit: bool = True) -> bool:
         """
         Execute a SQL statement.
@@ -225,17 +560,22 @@ class HePgDao(HeDbDao):
         :return: True if execution successful
         """
         try:
+            if self.conn and (self.pre_ping or self.pool_recycle):
+                self._check_connection()
             if not self.conn or not self.cursor:
                 self.last_error = "Not connected to database"
                 return False
 
+            query = _normalize_sql(sql)
             if params:
-                self.cursor.execute(sql, params)
+                self.cursor.execute(query, params)
             else:
-                self.cursor.execute(sql)
+                self.cursor.execute(query)
+            self._transaction_open = True
 
             if commit:
                 self.conn.commit()
+                self._transaction_open = False
 
             return True
 
@@ -254,14 +594,18 @@ class HePgDao(HeDbDao):
         :return: List of rows or None
         """
         try:
+            if self.conn and (self.pre_ping or self.pool_recycle):
+                self._check_connection()
             if not self.conn or not self.cursor:
                 self.last_error = "Not connected to database"
                 return None
 
+            query = _normalize_sql(sql)
             if params:
-                self.cursor.execute(sql, params)
+                self.cursor.execute(query, params)
             else:
-                self.cursor.execute(sql)
+                self.cursor.execute(query)
+            self._transaction_open = True
 
             return self.cursor.fetchall()
 
@@ -279,14 +623,18 @@ class HePgDao(HeDbDao):
         :return: First row or None
         """
         try:
+            if self.conn and (self.pre_ping or self.pool_recycle):
+                self._check_connection()
             if not self.conn or not self.cursor:
                 self.last_error = "Not connected to database"
                 return None
 
+            query = _normalize_sql(sql)
             if params:
-                self.cursor.execute(sql, params)
+                self.cursor.execute(query, params)
             else:
-                self.cursor.execute(sql)
+                self.cursor.execute(query)
+            self._transaction_open = True
 
             return self.cursor.fetchone()
 
@@ -304,15 +652,20 @@ class HePgDao(HeDbDao):
         :return: List of dictionaries or None
         """
         try:
+            if self.conn and (self.pre_ping or self.pool_recycle):
+                self._check_connection()
             if not self.conn:
                 self.last_error = "Not connected to database"
                 return None
 
+            from psycopg.rows import dict_row
+            query = _normalize_sql(sql)
             with self.conn.cursor(row_factory=dict_row) as cur:
                 if params:
-                    cur.execute(sql, params)
+                    cur.execute(query, params)
                 else:
-                    cur.execute(sql)
+                    cur.execute(query)
+                self._transaction_open = True
                 return cur.fetchall()
 
         except Exception as e:
@@ -326,7 +679,7 @@ class HePgDao(HeDbDao):
 
         :return: New DAO instance with same connection parameters
         """
-        new_dao = HePgDao()
+        new_dao = HePgDao(pre_ping=self.pre_ping, pool_recycle=self.pool_recycle, pool_size=self.pool_size)
         if self._connection_params:
             new_dao.connect(**self._connection_params)
         return new_dao
@@ -349,24 +702,43 @@ class HeSqliteDao(HeDbDao):
         super().__init__()
         self.db_type = DbType.SQLITE
         self.db_path: Optional[str] = None
+        self._pool_size = 0
+        self._pool_key: Optional[str] = None
+        self._fast_mode = False
+        self._in_transaction = False
+        self._transaction_failed = False
 
-    def connect(self, db_path: str, **kwargs) -> bool:
+    def connect(self, db_path: PathType, pool_size: int = 0, fast_mode: bool = False, **kwargs) -> bool:
         """
         Connect to SQLite database.
 
-        :param db_path: Path to SQLite database file
+        :param db_path: Path to SQLite database file, ":memory:" or a "file:" URI
+            (e.g. "file:name?mode=memory&cache=shared" for a named in-memory database)
+        :param pool_size: Number of idle connections to keep open for this database on close_db,
+            so that the next connect reuses one instead of opening and configuring a new one
+            (default 0, no pooling)
+        :param fast_mode: Open new connections in WAL mode with synchronous=NORMAL and memory-mapped
+            reads (default False). WAL is persistent in the database file: only enable it for files
+            that are not shared with tools that don't support WAL
         :return: True if connection successful
         """
         try:
+            db_path = os.fspath(db_path)
             self.db_path = db_path
-            self.conn = sqlite3.connect(db_path, check_same_thread=False)
-            self.conn.row_factory = sqlite3.Row
-            self.cursor = self.conn.cursor()
-
-            # Enable foreign keys
-            self.cursor.execute("PRAGMA foreign_keys = ON")
+            self._pool_size = pool_size
+            self._fast_mode = fast_mode
+            self._pool_key = _sqlite_pool_key(db_path, self.db_type, fast_mode) if pool_size > 0 else None
+
+            conn = _pool_checkout(_SQLITE_POOL, self._pool_key) if self._pool_key else None
+            if conn is None:
+                conn = sqlite3.connect(db_path, check_same_thread=False, uri=db_path.startswith("file:"))
+                self._configure_connection(conn)
+                tools_log.log_info(f"Connected to SQLite database: {db_path}")
+            else:
+                tools_log.log_info(f"Reusing pooled SQLite connection: {db_path}")
 
-            tools_log.log_info(f"Connected to SQLite database: {db_path}")
+            self.conn = conn
+            self.cursor = self.conn.cursor()
             return True
 
         except Exception as e:
@@ -374,6 +746,17 @@ class HeSqliteDao(HeDbDao):
             tools_log.log_error(f"SQLite connection error: {e}")
             return False
 
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply per-connection settings to a newly opened connection.
+        Runs once per connection: pooled connections handed out again keep their settings.
+
+        :param conn: New SQLite connection
+        """
+        conn.row_factory = sqlite3.Row
+        # Apply connection PRAGMAs in a single call
+        conn.executescript(_SQLITE_PRAGMAS_SQL + _SQLITE_FAST_PRAGMAS_SQL if self._fast_mode else _SQLITE_PRAGMAS_SQL)
+
     def close_db(self) -> None:
         """Close the database connection."""
         try:
@@ -381,7 +764,14 @@ class HeSqliteDao(HeDbDao):
                 self.cursor.close()
                 self.cursor = None
             if self.conn:
-                self.conn.close()
+                if self._pool_key:
+                    # Never hand an open transaction to the next user of the connection
+                    if self.conn.in_transaction:
+                        self.conn.rollback()
+                    if not _pool_checkin(_SQLITE_POOL, self._pool_key, self.conn, self._pool_size):
+                        self.conn.close()
+                else:
+                    self.conn.close()
                 self.conn = None
             tools_log.log_info("SQLite connection closed")
         except Exception as e:
@@ -401,13 +791,16 @@ class HeSqliteDao(HeDbDao):
             if not self.conn or not self.cursor:
                 self.last_error = "Not connected to database"
                 return False
+            if self._transaction_failed:
+                self.last_error = "Current transaction is aborted, statement skipped"
+                return False
 
             if params:
                 self.cursor.execute(sql, params)
             else:
                 self.cursor.execute(sql)
 
-            if commit:
+            if commit and not self._in_transaction:
                 self.conn.commit()
 
             return True
@@ -415,7 +808,7 @@ class HeSqliteDao(HeDbDao):
         except Exception as e:
             self.last_error = str(e)
             tools_log.log_error(f"Execute error: {e}\nSQL: {sql}")
-            self.rollback()
+            self._abort()
             return False
 
     def get_rows(self, sql: str, params: Optional[tuple] = None) -> Optional[List[tuple]]:
@@ -468,15 +861,156 @@ class HeSqliteDao(HeDbDao):
             tools_log.log_error(f"Query error: {e}\nSQL: {sql}")
             return None
 
-    def clone(self) -> "HeSqliteDao":
+    def execute_many(
+        self,
+        sql: str,
+        seq_params: Iterable[Sequence[Any]],
+        commit: bool = True,
+        batch_size: int = 500
+    ) -> bool:
+        """
+        Execute a SQL statement once per parameter set.
+        Plain single-row "INSERT ... VALUES (?, ...)" statements are rewritten into multi-row
+        inserts (as many rows per statement as SQLite's bound-parameter limit allows); any other
+        statement (upserts, RETURNING, literals, numbered or named parameters...) goes through
+        sqlite3's executemany.
+
+        :param sql: SQL statement with '?' placeholders
+        :param seq_params: Sequence of parameter tuples
+        :param commit: Whether to commit after execution
+        :param batch_size: Maximum number of rows per multi-row INSERT
+        :return: True if execution successful
+        """
+        try:
+            if not self.conn or not self.cursor:
+                self.last_error = "Not connected to database"
+                return False
+            if self._transaction_failed:
+                self.last_error = "Current transaction is aborted, statement skipped"
+                return False
+
+            match = _INSERT_VALUES_RE.match(sql)
+            n_params = match.group(1).count("?") if match else 0
+            if n_params:
+                rows = list(seq_params)
+                if any(len(row) != n_params for row in rows):
+                    # Flattened, a short or long row would shift every later row's values into the
+                    # wrong columns: let executemany reject the bad binding count instead
+                    n_params = 0
+                    seq_params = rows
+            if n_params:
+                head = sql[:match.start(1)]
+                values = match.group(1)
+                rows_per_stmt = max(1, min(batch_size, _SQLITE_MAX_VARIABLES // n_params))
+                statements: Dict[int, str] = {}
+                for start in range(0, len(rows), rows_per_stmt):
+                    chunk = rows[start:start + rows_per_stmt]
+                    stmt = statements.get(len(chunk))
+                    if stmt is None:
+                        stmt = head + ",".join([values] * len(chunk))
+                        statements[len(chunk)] = stmt
+                    self.cursor.execute(stmt, [value for row in chunk for value in row])
+            else:
+                self.cursor.executemany(sql, seq_params)
+
+            if commit and not self._in_transaction:
+                self.conn.commit()
+
+            return True
+
+        except Exception as e:
+            self.last_error = str(e)
+            tools_log.log_error(f"Execute error: {e}\nSQL: {sql}")
+            self._abort()
+            return False
+
+    def _abort(self) -> None:
+        """
+        Handle a failed statement: roll back right away outside a transaction block, or mark
+        the open transaction as failed so that it is rolled back as a whole on exit.
+        """
+        if self._in_transaction:
+            self._transaction_failed = True
+        else:
+            self.rollback()
+
+    @contextmanager
+    def transaction(self) -> Iterator["HeSqliteDao"]:
+        """
+        Group several statements into a single write transaction.
+        execute/execute_many calls inside the block neither commit nor roll back on their own;
+        the transaction is committed once on exit, or rolled back if the block raises.
+        If any statement fails, the following ones are skipped (returning False) and the whole
+        transaction is rolled back on exit, so it is never half-applied.
+        Nested blocks join the outer transaction.
+
+        :return: This DAO
+        """
+        if self._in_transaction or not self.conn:
+            yield self
+            return
+
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        self._in_transaction = True
+        self._transaction_failed = False
+        try:
+            yield self
+        except Exception:
+            self.rollback()
+            raise
+        else:
+            if self._transaction_failed:
+                tools_log.log_warning("Transaction rolled back after a failed statement")
+                self.rollback()
+            elif not self.commit():
+                self.rollback()
+        finally:
+            self._in_transaction = False
+            self._transaction_failed = False
+
+    def get_rows_dict(self, sql: str, params: Optional[tuple] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Execute a query and return all rows as dictionaries.
+
+        :param sql: SQL query
+        :param params: Query parameters
+        :return: List of dictionaries or None
+        """
+        rows = self.get_rows(sql, params)
+        if rows is None:
+            return None
+        if not rows:
+            return []
+        # Zip each row with the column names read once from the cursor: map/zip/dict all run in C,
+        # unlike a per-row dict(sqlite3.Row) that goes through keys() and item lookups
+        columns = [column[0] for column in self.cursor.description]
+        return list(map(dict, map(zip, repeat(columns), rows)))
+
+    def clone(self, read_only: bool = False) -> "HeSqliteDao":
         """
         Create a clone of this DAO with a new connection.
 
+        :param read_only: Open the clone read-only (mode=ro, query_only), e.g. for reader threads
+            that query the database while this DAO writes to it
         :return: New DAO instance
         """
-        new_dao = HeSqliteDao()
-        if self.db_path:
-            new_dao.connect(self.db_path)
+        return self._clone_into(HeSqliteDao(), read_only)
+
+    def _clone_into(self, new_dao: "HeSqliteDao", read_only: bool) -> "HeSqliteDao":
+        """
+        Connect a new DAO to this DAO's database with the same settings.
+
+        :param new_dao: Unconnected DAO instance
+        :param read_only: Open the connection read-only
+        :return: new_dao
+        """
+        if not self.db_path:
+            return new_dao
+        if not read_only:
+            new_dao.connect(self.db_path, pool_size=self._pool_size, fast_mode=self._fast_mode)
+        elif new_dao.connect(_sqlite_read_only_uri(self.db_path), fast_mode=self._fast_mode):
+            new_dao.conn.execute("PRAGMA query_only = ON")
         return new_dao
 
 
@@ -490,7 +1024,7 @@ class HeGpkgDao(HeSqliteDao):
         super().__init__()
         self.db_type = DbType.GEOPACKAGE
 
-    def connect(self, gpkg_path: str, **kwargs) -> bool:
+    def connect(self, gpkg_path: PathType, **kwargs) -> bool:
         """
         Connect to GeoPackage database.
 
@@ -499,27 +1033,33 @@ class HeGpkgDao(HeSqliteDao):
         """
         result = super().connect(gpkg_path, **kwargs)
         if result:
-            # Load spatialite extension if available
-            try:
-                self.conn.enable_load_extension(True)
-                # Try to load mod_spatialite (optional)
-                # self.conn.load_extension("mod_spatialite")
-            except Exception:
-                # Spatialite not available, continue without it
-                pass
             tools_log.log_info(f"Connected to GeoPackage: {gpkg_path}")
         return result
 
-    def clone(self) -> "HeGpkgDao":
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply SQLite settings and enable extension loading on a newly opened connection.
+
+        :param conn: New SQLite connection
+        """
+        super()._configure_connection(conn)
+        # Load spatialite extension if available
+        try:
+            conn.enable_load_extension(True)
+            # Try to load mod_spatialite (optional)
+            # conn.load_extension("mod_spatialite")
+        except Exception:
+            # Spatialite not available, continue without it
+            pass
+
+    def clone(self, read_only: bool = False) -> "HeGpkgDao":
         """
         Create a clone of this DAO with a new connection.
 
+        :param read_only: Open the clone read-only (mode=ro, query_only)
         :return: New DAO instance
         """
-        new_dao = HeGpkgDao()
-        if self.db_path:
-            new_dao.connect(self.db_path)
-        return new_dao
+        return self._clone_into(HeGpkgDao(), read_only)
 
     def get_tables(self) -> Optional[List[str]]:
         """
@@ -527,8 +1067,7 @@ class HeGpkgDao(HeSqliteDao):
 
         :return: List of table names or None
         """
-        sql = "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'gpkg_%' AND name NOT LIKE 'sqlite_%'"
-        rows = self.get_rows(sql)
+        rows = self.get_rows(_LIST_TABLES_SQL)
         if rows:
             return [row[0] for row in rows]
         return None
@@ -539,24 +1078,7 @@ class HeGpkgDao(HeSqliteDao):
 
         :return: List of geometry table info or None
         """
-        sql = """
-            SELECT table_name, data_type, identifier, description, srs_id 
-            FROM gpkg_contents 
-            WHERE data_type IN ('features', 'tiles')
-        """
-        rows = self.get_rows(sql)
-        if rows:
-            return [
-                {
-                    "table_name": row[0],
-                    "data_type": row[1],
-                    "identifier": row[2],
-                    "description": row[3],
-                    "srs_id": row[4]
-                }
-                for row in rows
-            ]
-        return None
+        return self.get_rows_dict(_GEOM_TABLES_SQL) or None
 
 
 # =============================================================================
@@ -571,6 +1093,9 @@ def create_pg_connection(
     password: str = "",
     schema: Optional[str] = None,
     set_as_default: bool = True,
+    pre_ping: bool = False,
+    pool_recycle: Optional[int] = 1800,
+    pool_size: int = 0,
     **kwargs
 ) -> Optional[HePgDao]:
     """
@@ -583,11 +1108,14 @@ def create_pg_connection(
     :param password: Password
     :param schema: Default schema (optional)
     :param set_as_default: Set this connection as the default global connection
+    :param pre_ping: Check the connection before each statement and reconnect if dead
+    :param pool_recycle: Reconnect idle connections older than this many seconds (None to disable)
+    :param pool_size: Idle connections kept open for reuse after close (default 0, no pooling)
     :return: HePgDao instance or None if connection failed
     """
     from ..config import config
 
-    dao = HePgDao()
+    dao = HePgDao(pre_ping=pre_ping, pool_recycle=pool_recycle, pool_size=pool_size)
     if dao.connect(host=host, port=port, dbname=dbname, user=user, password=password, schema=schema, **kwargs):
         if set_as_default:
             # Close existing connection if any
@@ -599,8 +1127,9 @@ def create_pg_connection(
 
 
 def create_gpkg_connection(
-    gpkg_path: str,
+    gpkg_path: PathType,
     set_as_default: bool = True,
+    fast_mode: bool = False,
     **kwargs
 ) -> Optional[HeGpkgDao]:
     """
@@ -608,12 +1137,14 @@ def create_gpkg_connection(
 
     :param gpkg_path: Path to GeoPackage file
     :param set_as_default: Set this connection as the default global connection
+    :param fast_mode: Use WAL journaling, synchronous=NORMAL and mmap reads (default False).
+        Leave disabled for GeoPackages opened by other GIS tools, which may not support WAL
     :return: HeGpkgDao instance or None if connection failed
     """
     from ..config import config
 
     dao = HeGpkgDao()
-    if dao.connect(gpkg_path, **kwargs):
+    if dao.connect(gpkg_path, fast_mode=fast_mode, **kwargs):
         if set_as_default:
             # Close existing connection if any
             if config.session_vars.get('db_connection'):
@@ -624,21 +1155,25 @@ def create_gpkg_connection(
 
 
 def create_sqlite_connection(
-    db_path: str,
+    db_path: PathType,
     set_as_default: bool = True,
+    pool_size: int = 0,
+    fast_mode: bool = False,
     **kwargs
 ) -> Optional[HeSqliteDao]:
     """
     Create a SQLite connection.
 
-    :param db_path: Path to SQLite database file
+    :param db_path: Path to SQLite database file, ":memory:" or a "file:" URI
     :param set_as_default: Set this connection as the default global connection
+    :param pool_size: Idle connections kept open for reuse after close (default 0, no pooling)
+    :param fast_mode: Use WAL journaling, synchronous=NORMAL and mmap reads (default False)
     :return: HeSqliteDao instance or None if connection failed
     """
     from ..config import config
 
     dao = HeSqliteDao()
-    if dao.connect(db_path, **kwargs):
+    if dao.connect(db_path, pool_size=pool_size, fast_mode=fast_mode, **kwargs):
         if set_as_default:
             # Close existing connection if any
             if config.session_vars.get('db_connection'):
@@ -15,6 +15,82 @@ from ..config import config
 from . import tools_os
 
 
+# Mirror of config.logger, set by set_logger. The log_* helpers re-sync it when config.logger was
+# assigned directly, so they never write to a replaced logger
+_active_logger: Optional["HeLogger"] = None
+
+
+class _FastFileHandler(logging.FileHandler):
+    """
+    File handler that appends each formatted record with a direct os.write on an O_APPEND descriptor.
+    Every record reaches the file as soon as it is emitted, bypassing Python's buffered io layer.
+    The handler can be shared by several HeLogger instances writing to the same file; `owners`
+    counts them so that it is only closed when the last one releases it.
+    """
+
+    _OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+    def __init__(self, filename: str, encoding: str = "utf-8"):
+        # delay=True: the base class never opens its own stream
+        super().__init__(filename, encoding=encoding, delay=True)
+        self.fd: Optional[int] = os.open(self.baseFilename, self._OPEN_FLAGS, 0o644)
+        self.owners = 0
+
+    def reopen(self) -> None:
+        """Reopen the file descriptor, e.g. after the log file was removed from disk"""
+        self.acquire()
+        try:
+            if self.fd is not None:
+                os.close(self.fd)
+            self.fd = os.open(self.baseFilename, self._OPEN_FLAGS, 0o644)
+        finally:
+            self.release()
+
+    def add_owner(self) -> None:
+        """Register one more logger using this handler"""
+        self.acquire()
+        try:
+            self.owners += 1
+        finally:
+            self.release()
+
+    def release_owner(self) -> int:
+        """
+        Unregister one logger using this handler.
+
+        :return: Number of loggers still using it
+        """
+        self.acquire()
+        try:
+            self.owners = max(0, self.owners - 1)
+            return self.owners
+        finally:
+            self.release()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format record and write it with a single syscall (looping only on short writes)"""
+        try:
+            if self.fd is None:
+                return
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            while data:
+                written = os.write(self.fd, data)
+                data = data[written:]
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Close the file descriptor"""
+        self.acquire()
+        try:
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+        finally:
+            self.release()
+        super().close()
+
+
 class HeLogger:
     """
     Logger class for Hydraulic Engine package.
@@ -42,8 +118,7 @@ class HeLogger:
         if folder_has_tstamp:
             tstamp = str(time.strftime(log_suffix))
             log_folder += tstamp + os.sep
-        if not os.path.exists(log_folder):
-            os.makedirs(log_folder)
+        tools_os.ensure_dir(log_folder)
 
         # Define filename
         filepath = log_folder + log_name
@@ -80,20 +155,34 @@ class HeLogger:
                 pass
 
     def add_file_handler(self) -> None:
-        """Add file handler to logger"""
+        """
+        Add file handler to logger, sharing the existing one if the logger already writes to this file.
+        A shared handler whose file no longer exists (e.g. removed with remove_previous) is reopened first.
+        """
+        filepath = os.path.abspath(self.filepath)
+        for handler in self.logger_file.handlers:
+            if isinstance(handler, _FastFileHandler) and handler.baseFilename == filepath:
+                if not os.path.exists(filepath):
+                    handler.reopen()
+                handler.add_owner()
+                self.fh = handler
+                return
+
         log_format = '%(asctime)s [%(levelname)s] - %(message)s\n'
         log_date = '%d/%m/%Y %H:%M:%S'
         formatter = logging.Formatter(log_format, log_date)
-        self.fh = logging.FileHandler(self.filepath)
+        self.fh = _FastFileHandler(self.filepath)
         self.fh.setFormatter(formatter)
+        self.fh.add_owner()
         self.logger_file.addHandler(self.fh)
 
     def close_logger(self) -> None:
-        """Remove file handler and close logger"""
+        """Release file handler, removing and closing it if no other logger instance still uses it"""
         try:
-            self.logger_file.removeHandler(self.fh)
-            self.fh.flush()
-            self.fh.close()
+            if self.fh.release_owner() == 0:
+                self.logger_file.removeHandler(self.fh)
+                self.fh.flush()
+                self.fh.close()
             del self.fh
         except Exception:
             pass
@@ -156,30 +245,51 @@ def set_logger(logger_name: str, min_log_level: int = 20) -> None:
     :param logger_name: Name for the logger
     :param min_log_level: Minimum log level (default: 20 = INFO)
     """
+    global _active_logger
     if config.logger is None:
         log_suffix = '%Y%m%d'
         config.logger = HeLogger(logger_name, min_log_level, str(log_suffix))
+    _active_logger = config.logger
+
+
+def _sync_active_logger() -> Optional["HeLogger"]:
+    """Point the mirror at config.logger again, after it was assigned without set_logger"""
+    global _active_logger
+    _active_logger = config.logger
+    return _active_logger
 
 
 def log_debug(text: Optional[str] = None, logger_file: bool = True, stack_level_increase: int = 0) -> None:
     """Write debug message to log file"""
-    if config.logger and logger_file:
-        config.logger.debug(text, stack_level_increase=stack_level_increase)
+    logger = _active_logger
+    if logger is not config.logger:
+        logger = _sync_active_logger()
+    if logger and logger_file:
+        logger.debug(text, stack_level_increase=stack_level_increase)
 
 
 def log_info(text: Optional[str] = None, logger_file: bool = True, stack_level_increase: int = 0) -> None:
     """Write info message to log file"""
-    if config.logger and logger_file:
-        config.logger.info(text, stack_level_increase=stack_level_increase)
+    logger = _active_logger
+    if logger is not config.logger:
+        logger = _sync_active_logger()
+    if logger and logger_file:
+        logger.info(text, stack_level_increase=stack_level_increase)
 
 
 def log_warning(text: Optional[str] = None, logger_file: bool = True, stack_level_increase: int = 0) -> None:
     """Write warning message to log file"""
-    if config.logger and logger_file:
-        config.logger.warning(text, stack_level_increase=stack_level_increase)
+    logger = _active_logger
+    if logger is not config.logger:
+        logger = _sync_active_logger()
+    if logger and logger_file:
+        logger.warning(text, stack_level_increase=stack_level_increase)
 
 
 def log_error(text: Optional[str] = None, logger_file: bool = True, stack_level_increase: int = 0) -> None:
     """Write error message to log file"""
-    if config.logger and logger_file:
-        config.logger.error(text, stack_level_increase=stack_level_increase)
+    logger = _active_logger
+    if logger is not config.logger:
+        logger = _sync_active_logger()
+    if logger and logger_file:
+        logger.error(text, stack_level_increase=stack_level_increase)
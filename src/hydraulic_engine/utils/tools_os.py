@@ -6,10 +6,89 @@ or (at your option) any later version.
 """
 # -*- coding: utf-8 -*-
 import os
+import stat
 import sys
 import platform
-from pathlib import Path
-from typing import Optional
+import tempfile
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from . import _statx
+
+# Path arguments accept str or any os.PathLike (e.g. pathlib.Path) without a str() round-trip
+PathType = Union[str, "os.PathLike[str]"]
+
+
+# Directories relative to the user home, keyed by sys.platform family (others fall back to home)
+_DATADIR_BY_PLATFORM = {
+    "win32": ("AppData", "Roaming"),
+    "linux": (".local", "share"),
+    "darwin": ("Library", "Application Support"),  # macOS
+}
+_CONFIG_DIR_BY_PLATFORM = {
+    "win32": ("AppData", "Local"),
+    "linux": (".config",),
+    "darwin": ("Library", "Preferences"),  # macOS
+}
+
+
+def _get_platform_key() -> str:
+    """Return the sys.platform family ('win32', 'linux', 'darwin') or sys.platform itself"""
+    for key in _DATADIR_BY_PLATFORM:
+        if sys.platform.startswith(key):
+            return key
+    return sys.platform
+
+
+def _compute_datadir(home: str) -> str:
+    return sys.intern(os.path.join(home, *_DATADIR_BY_PLATFORM.get(_PLATFORM, ())))
+
+
+def _compute_config_dir(home: str) -> str:
+    return sys.intern(os.path.join(home, *_CONFIG_DIR_BY_PLATFORM.get(_PLATFORM, ())))
+
+
+# True when '/' is the only path separator, so plain string joins are equivalent to os.path.join
+_POSIX_SEP = os.sep == '/' and os.altsep is None
+
+# Platform-dependent directories, resolved and interned once at import (see _refresh)
+_PLATFORM = _get_platform_key()
+_HOME = os.path.expanduser("~")
+_DATADIR = _compute_datadir(_HOME)
+_CONFIG_DIR = _compute_config_dir(_HOME)
+_TEMP_DIR = sys.intern(tempfile.gettempdir())
+_PYTHON_VERSION = sys.intern(f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
+
+
+def _build_platform_info() -> Mapping[str, str]:
+    if hasattr(os, "uname"):
+        # POSIX: one uname call provides all fields
+        uname = os.uname()
+        system, release, version, machine = uname.sysname, uname.release, uname.version, uname.machine
+    else:
+        uname = platform.uname()
+        system, release, version, machine = uname.system, uname.release, uname.version, uname.machine
+    return MappingProxyType({
+        "system": system,
+        "release": release,
+        "version": version,
+        "machine": machine,
+        "python_version": _PYTHON_VERSION,
+    })
+
+
+_PLATFORM_INFO = _build_platform_info()
+
+
+def _refresh() -> None:
+    """Recompute the cached directories (e.g. after HOME or TMPDIR changed)"""
+    global _HOME, _DATADIR, _CONFIG_DIR, _TEMP_DIR
+    tempfile.tempdir = None
+    _HOME = os.path.expanduser("~")
+    _DATADIR = _compute_datadir(_HOME)
+    _CONFIG_DIR = _compute_config_dir(_HOME)
+    _TEMP_DIR = sys.intern(tempfile.gettempdir())
 
 
 def get_datadir() -> str:
@@ -22,17 +101,7 @@ def get_datadir() -> str:
 
     :return: Path to data directory
     """
-    home = Path.home()
-    system = platform.system()
-
-    if system == "Windows":
-        return str(home / "AppData" / "Roaming")
-    elif system == "Linux":
-        return str(home / ".local" / "share")
-    elif system == "Darwin":  # macOS
-        return str(home / "Library" / "Application Support")
-    else:
-        return str(home)
+    return _DATADIR
 
 
 def get_config_dir() -> str:
@@ -45,74 +114,181 @@ def get_config_dir() -> str:
 
     :return: Path to config directory
     """
-    home = Path.home()
-    system = platform.system()
-
-    if system == "Windows":
-        return str(home / "AppData" / "Local")
-    elif system == "Linux":
-        return str(home / ".config")
-    elif system == "Darwin":  # macOS
-        return str(home / "Library" / "Preferences")
-    else:
-        return str(home)
+    return _CONFIG_DIR
 
 
 def get_temp_dir() -> str:
     """
     Returns the system temporary directory.
+    Resolved once at import with tempfile.gettempdir() (call _refresh() after changing TMPDIR).
 
     :return: Path to temporary directory
     """
-    import tempfile
-    return tempfile.gettempdir()
+    return _TEMP_DIR
 
 
-def ensure_dir(path: str) -> bool:
+def ensure_dir(path: PathType) -> bool:
     """
     Ensure that a directory exists, creating it if necessary.
 
     :param path: Path to the directory
     :return: True if directory exists or was created, False on error
     """
+    # Common case: the directory already exists, answered by one stat without raising
+    if dir_exists(path):
+        return True
     try:
-        os.makedirs(path, exist_ok=True)
+        os.mkdir(path)
         return True
+    except FileExistsError:
+        return dir_exists(path)
+    except FileNotFoundError:
+        # Missing parent: create the whole chain
+        try:
+            os.makedirs(path, exist_ok=True)
+            return True
+        except OSError:
+            return False
     except OSError:
         return False
 
 
-def file_exists(path: str) -> bool:
+def get_file_type(path: PathType, dont_sync: bool = False) -> int:
+    """
+    Get the file type bits of a path with a single stat call.
+    Callers that need to tell files from directories should call this once
+    and compare against stat.S_IFREG / stat.S_IFDIR.
+
+    :param path: Path to check
+    :param dont_sync: On Linux, use statx(AT_STATX_DONT_SYNC) so network filesystems may
+                      answer from cached attributes (falls back to os.stat elsewhere)
+    :return: stat.S_IFMT of the path's mode, or 0 if it does not exist
+    """
+    if dont_sync:
+        return _statx.get_file_type(path)
+    try:
+        return stat.S_IFMT(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return 0
+
+
+def exists_many(paths: Iterable[PathType]) -> Dict[PathType, int]:
+    """
+    Get the file type of many paths at once.
+    Paths are grouped by parent directory and each directory is listed once with os.scandir,
+    so the type comes from the directory entry instead of one stat call per path.
+
+    :param paths: Paths to check
+    :return: Dict mapping each path to stat.S_IFREG, stat.S_IFDIR, other S_IFMT bits, or 0 if missing
+    """
+    by_dir: Dict[str, List[Tuple[PathType, str]]] = defaultdict(list)
+    for path in paths:
+        by_dir[os.path.dirname(path)].append((path, os.path.basename(path)))
+
+    result: Dict[PathType, int] = {}
+    for dirname, items in by_dir.items():
+        if len(items) == 1:
+            path = items[0][0]
+            result[path] = get_file_type(path)
+            continue
+        try:
+            with os.scandir(dirname or os.curdir) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = None
+        for path, name in items:
+            entry = entries.get(name) if entries is not None else None
+            if entry is None:
+                # Not listed ('.', '..', trailing separator, case-insensitive match, unreadable dir)
+                result[path] = get_file_type(path)
+            elif entry.is_dir():
+                result[path] = stat.S_IFDIR
+            elif entry.is_file():
+                result[path] = stat.S_IFREG
+            else:
+                result[path] = get_file_type(path)
+    return result
+
+
+def file_exists(path: PathType, dont_sync: bool = False) -> bool:
     """
     Check if a file exists.
 
     :param path: Path to the file
+    :param dont_sync: Allow cached attributes on network filesystems (see get_file_type)
     :return: True if file exists
     """
-    return os.path.isfile(path)
+    return get_file_type(path, dont_sync) == stat.S_IFREG
 
 
-def dir_exists(path: str) -> bool:
+def dir_exists(path: PathType, dont_sync: bool = False) -> bool:
     """
     Check if a directory exists.
 
     :param path: Path to the directory
+    :param dont_sync: Allow cached attributes on network filesystems (see get_file_type)
     :return: True if directory exists
     """
-    return os.path.isdir(path)
+    return get_file_type(path, dont_sync) == stat.S_IFDIR
+
+
+# Separator scanning specialized for the platform: POSIX paths only ever need to look for '/'
+if _POSIX_SEP:
+    _SEPARATORS = '/'
+
+    def _rfind_sep(path: str) -> int:
+        return path.rfind('/')
+else:
+    _SEPARATORS = '/\\'
+
+    def _rfind_sep(path: str) -> int:
+        return max(path.rfind('/'), path.rfind('\\'))
+
+
+def _ext_index(path: str, sep: int) -> int:
+    """Index where the extension of path starts (len(path) if none), given the last separator index"""
+    dot = path.rfind('.')
+    if dot <= sep:
+        return len(path)
+    # Leading dots of the filename do not start an extension (e.g. '.bashrc')
+    i = sep + 1
+    while i < dot and path[i] == '.':
+        i += 1
+    if i == dot:
+        return len(path)
+    return dot
+
+
+def split_parts(path: PathType) -> Tuple[str, str, str]:
+    """
+    Split a path into directory, filename and extension with a single reverse scan.
+
+    :param path: Path to the file
+    :return: Tuple of (directory, filename with extension, extension with dot)
+    """
+    path = os.fspath(path)
+    sep = _rfind_sep(path)
+    head = path[:sep + 1]
+    dirname = head.rstrip(_SEPARATORS) or head
+    return dirname, path[sep + 1:], path[_ext_index(path, sep):]
 
 
-def get_file_extension(path: str) -> str:
+def get_file_extension(path: PathType) -> str:
     """
     Get the file extension from a path.
 
     :param path: Path to the file
     :return: File extension (with dot, e.g., '.inp')
     """
-    return os.path.splitext(path)[1]
+    path = os.fspath(path)
+    if not path or '.' not in path:
+        return ''
+    # Reverse scan instead of os.path.splitext: same result, no tuple allocation
+    sep = _rfind_sep(path)
+    return path[_ext_index(path, sep):]
 
 
-def get_filename(path: str, with_extension: bool = True) -> str:
+def get_filename(path: PathType, with_extension: bool = True) -> str:
     """
     Get the filename from a path.
 
@@ -120,18 +296,34 @@ def get_filename(path: str, with_extension: bool = True) -> str:
     :param with_extension: Include extension in result
     :return: Filename
     """
+    path = os.fspath(path)
+    if not path:
+        return ''
     if with_extension:
+        if _POSIX_SEP:
+            return path[path.rfind('/') + 1:]
+        # Windows: keep os.path.basename for drive-relative paths such as 'C:model.inp'
         return os.path.basename(path)
-    return os.path.splitext(os.path.basename(path))[0]
+    _, filename, ext = split_parts(path)
+    return filename[:len(filename) - len(ext)]
 
 
-def join_path(*args: str) -> str:
+def join_path(*args: PathType) -> str:
     """
     Join path components.
 
     :param args: Path components
     :return: Joined path
     """
+    if _POSIX_SEP and args and args[0]:
+        try:
+            joined = '/'.join(args)
+        except TypeError:
+            # Non-str components (e.g. PathLike or bytes)
+            return os.path.join(*args)
+        # A doubled separator means an absolute/empty component or a trailing slash: defer to os.path.join
+        if '//' not in joined:
+            return joined
     return os.path.join(*args)
 
 
@@ -141,19 +333,13 @@ def get_python_version() -> str:
 
     :return: Python version string
     """
-    return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    return _PYTHON_VERSION
 
 
-def get_platform_info() -> dict:
+def get_platform_info() -> Mapping[str, str]:
     """
     Get platform information.
 
-    :return: Dictionary with platform info
+    :return: Read-only mapping with platform info (copy it with dict() to modify)
     """
-    return {
-        "system": platform.system(),
-        "release": platform.release(),
-        "version": platform.version(),
-        "machine": platform.machine(),
-        "python_version": get_python_version(),
-    }
+    return _PLATFORM_INFO
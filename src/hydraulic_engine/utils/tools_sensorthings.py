@@ -12,13 +12,23 @@ import time
 import wntr
 import os
 
-from typing import Dict, List, Optional, Tuple, Literal
+from itertools import chain, count
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Literal, Set, Union
 from swmm_api.input_file import SwmmInput
 
 from .tools_api import get_api_client, HeFrostClient
 from . import tools_log
 
 
+# Units of measurement shared by the observed properties below
+_UNIT_METER = {'name': 'Meter', 'symbol': 'm', 'definition': 'ucum:m'}
+_UNIT_M3 = {'name': 'Cubic meters', 'symbol': 'm³', 'definition': 'ucum:m3'}
+_UNIT_M3PS = {'name': 'Cubic meters per second', 'symbol': 'm³/s', 'definition': 'ucum:m3/s'}
+_UNIT_MPS = {'name': 'Meters per second', 'symbol': 'm/s', 'definition': 'ucum:m/s'}
+_UNIT_MGL = {'name': 'Milligrams per liter', 'symbol': 'mg/L', 'definition': 'ucum:mg/L'}
+_UNIT_DIMENSIONLESS = {'name': 'Dimensionless', 'symbol': '', 'definition': 'ucum:1'}
+_UNIT_MGL_DAY = {'name': 'Milligrams per liter per day', 'symbol': 'mg/L/day', 'definition': 'ucum:mg.L-1.d-1'}
+
 # region SWMM
 
 # Observed properties configuration - single source of truth
@@ -28,56 +38,56 @@ SWMM_OBSERVED_PROPERTIES = {
         'name': 'Head',
         'description': 'Node head',
         'unit_symbol': 'm',
-        'unit': {'name': 'Meter', 'symbol': 'm', 'definition': 'ucum:m'}
+        'unit': _UNIT_METER
     },
     'depth': {
         'name': 'Depth',
         'description': 'Node depth',
         'unit_symbol': 'm',
-        'unit': {'name': 'Meter', 'symbol': 'm', 'definition': 'ucum:m'}
+        'unit': _UNIT_METER
     },
     'volume': {
         'name': 'Volume',
         'description': 'Node volume',
         'unit_symbol': 'm³',
-        'unit': {'name': 'Cubic meters', 'symbol': 'm³', 'definition': 'ucum:m3'}
+        'unit': _UNIT_M3
     },
     'lateral_inflow': {
         'name': 'Lateral Inflow',
         'description': 'Node lateral inflow',
         'unit_symbol': 'm³/s',
-        'unit': {'name': 'Cubic meters per second', 'symbol': 'm³/s', 'definition': 'ucum:m3/s'}
+        'unit': _UNIT_M3PS
     },
     'total_inflow': {
         'name': 'Total Inflow',
         'description': 'Node total inflow',
         'unit_symbol': 'm³/s',
-        'unit': {'name': 'Cubic meters per second', 'symbol': 'm³/s', 'definition': 'ucum:m3/s'}
+        'unit': _UNIT_M3PS
     },
     'flooding': {
         'name': 'Flooding',
         'description': 'Node flooding',
         'unit_symbol': 'm³/s',
-        'unit': {'name': 'Cubic meters per second', 'symbol': 'm³/s', 'definition': 'ucum:m3/s'}
+        'unit': _UNIT_M3PS
     },
     # Link properties
     'flow': {
         'name': 'Flow',
         'description': 'Link flow',
         'unit_symbol': 'm³/s',
-        'unit': {'name': 'Cubic meters per second', 'symbol': 'm³/s', 'definition': 'ucum:m3/s'}
+        'unit': _UNIT_M3PS
     },
     'velocity': {
         'name': 'Velocity',
         'description': 'Link velocity',
         'unit_symbol': 'm/s',
-        'unit': {'name': 'Meters per second', 'symbol': 'm/s', 'definition': 'ucum:m/s'}
+        'unit': _UNIT_MPS
     },
     'capacity': {
         'name': 'Capacity',
         'description': 'Link capacity',
         'unit_symbol': 'm³',
-        'unit': {'name': 'Cubic meters', 'symbol': 'm³', 'definition': 'ucum:m3'}
+        'unit': _UNIT_M3
     }
 }
 
@@ -86,6 +96,11 @@ SWMM_NODE_PROPERTIES = ['head', 'depth', 'volume', 'lateral_inflow', 'total_infl
 SWMM_LINK_PROPERTIES = ['flow', 'depth', 'velocity', 'volume', 'capacity']
 SWMM_NODE_TYPES = ['JUNCTION', 'OUTFALL', 'STORAGE', 'DIVIDER']
 
+# (section, type) pairs from lowest to highest precedence, so later sections win in the type indexes
+_SWMM_NODE_TYPE_SECTIONS = (('JUNCTIONS', 'JUNCTION'), ('DIVIDERS', 'DIVIDER'), ('STORAGE', 'STORAGE'),
+                            ('OUTFALLS', 'OUTFALL'))
+_SWMM_LINK_TYPE_SECTIONS = (('OUTLETS', 'OUTLET'), ('WEIRS', 'WEIR'), ('ORIFICES', 'ORIFICE'), ('PUMPS', 'PUMP'))
+
 # endregion
 
 # region EPANET
@@ -97,68 +112,68 @@ EPANET_OBSERVED_PROPERTIES = {
         'name': 'Pressure',
         'description': 'Node pressure',
         'unit_symbol': 'm',
-        'unit': {'name': 'Meter', 'symbol': 'm', 'definition': 'ucum:m'}
+        'unit': _UNIT_METER
     },
     'head': {
         'name': 'Head',
         'description': 'Node head',
         'unit_symbol': 'm',
-        'unit': {'name': 'Meter', 'symbol': 'm', 'definition': 'ucum:m'}
+        'unit': _UNIT_METER
     },
     'demand': {
         'name': 'Demand',
         'description': 'Node demand',
         'unit_symbol': 'm³/s',
-        'unit': {'name': 'Cubic meters per second', 'symbol': 'm³/s', 'definition': 'ucum:m3/s'}
+        'unit': _UNIT_M3PS
     },
     'quality': {
         'name': 'Quality',
         'description': 'Water quality',
         'unit_symbol': 'mg/L',
-        'unit': {'name': 'Milligrams per liter', 'symbol': 'mg/L', 'definition': 'ucum:mg/L'}
+        'unit': _UNIT_MGL
     },
     # Link properties
     'flowrate': {
         'name': 'Flow Rate',
         'description': 'Link flow rate',
         'unit_symbol': 'm³/s',
-        'unit': {'name': 'Cubic meters per second', 'symbol': 'm³/s', 'definition': 'ucum:m3/s'}
+        'unit': _UNIT_M3PS
     },
     'velocity': {
         'name': 'Velocity',
         'description': 'Link velocity',
         'unit_symbol': 'm/s',
-        'unit': {'name': 'Meters per second', 'symbol': 'm/s', 'definition': 'ucum:m/s'}
+        'unit': _UNIT_MPS
     },
     'headloss': {
         'name': 'Head Loss',
         'description': 'Link head loss',
         'unit_symbol': 'm',
-        'unit': {'name': 'Meter', 'symbol': 'm', 'definition': 'ucum:m'}
+        'unit': _UNIT_METER
     },
     'status': {
         'name': 'Status',
         'description': 'Link status',
         'unit_symbol': 'dimensionless',
-        'unit': {'name': 'Dimensionless', 'symbol': '', 'definition': 'ucum:1'}
+        'unit': _UNIT_DIMENSIONLESS
     },
     'setting': {
         'name': 'Setting',
         'description': 'Link setting',
         'unit_symbol': 'dimensionless',
-        'unit': {'name': 'Dimensionless', 'symbol': '', 'definition': 'ucum:1'}
+        'unit': _UNIT_DIMENSIONLESS
     },
     'friction_factor': {
         'name': 'Friction Factor',
         'description': 'Pipe friction factor',
         'unit_symbol': 'dimensionless',
-        'unit': {'name': 'Dimensionless', 'symbol': '', 'definition': 'ucum:1'}
+        'unit': _UNIT_DIMENSIONLESS
     },
     'reaction_rate': {
         'name': 'Reaction Rate',
         'description': 'Link reaction rate',
         'unit_symbol': 'mg/L/day',
-        'unit': {'name': 'Milligrams per liter per day', 'symbol': 'mg/L/day', 'definition': 'ucum:mg.L-1.d-1'}
+        'unit': _UNIT_MGL_DAY
     }
 }
 
@@ -170,8 +185,33 @@ EPANET_LINK_PROPERTIES = [
 ]
 EPANET_NODE_TYPES = ['JUNCTION', 'RESERVOIR', 'TANK']
 
+# Exact wntr class -> type, subclasses are resolved with isinstance and then cached
+_EPANET_NODE_TYPE = {
+    wntr.network.Junction: 'JUNCTION',
+    wntr.network.Reservoir: 'RESERVOIR',
+    wntr.network.Tank: 'TANK',
+}
+_EPANET_LINK_TYPE = {
+    wntr.network.Pipe: 'PIPE',
+    wntr.network.Pump: 'PUMP',
+    wntr.network.Valve: 'VALVE',
+}
+
 # endregion
 
+# Observation type of every Datastream created by this module
+OM_MEASUREMENT = "http://www.opengis.net/def/observationType/OGC-OM/2.0/OM_Measurement"
+
+# Per-engine lookups, precomputed once
+_ALL_PROPS = {
+    'swmm': frozenset(SWMM_NODE_PROPERTIES) | frozenset(SWMM_LINK_PROPERTIES),
+    'epanet': frozenset(EPANET_NODE_PROPERTIES) | frozenset(EPANET_LINK_PROPERTIES),
+}
+_PROP_CONFIG = {
+    'swmm': SWMM_OBSERVED_PROPERTIES,
+    'epanet': EPANET_OBSERVED_PROPERTIES,
+}
+
 def get_node_properties(engine: Literal['swmm', 'epanet']) -> List[str]:
     if engine == 'swmm':
         return SWMM_NODE_PROPERTIES
@@ -211,10 +251,8 @@ def geometry_changed(old_location: Dict, new_location: Dict) -> bool:
     :param new_location: New location data
     :return: True if geometry changed
     """
-    if not old_location:
-        return True
-    old_geom = old_location.get('location', {})
-    return old_geom != new_location
+    # A missing 'location' gives None, which never equals a GeoJSON dict
+    return not old_location or old_location.get('location') != new_location
 
 
 def create_thing_with_location(
@@ -311,14 +349,17 @@ def create_observed_property(
         tools_log.log_error("No FROST client available")
         return None
 
-    property_data = {
+    return client.create_entity('ObservedProperties', _observed_property_data(name, description))
+
+
+def _observed_property_data(name: str, description: str) -> Dict:
+    """Build the ObservedProperty entity body."""
+    return {
         "name": name,
         "description": description,
         "definition": f"http://example.org/def/{name.lower().replace(' ', '_')}"
     }
 
-    return client.create_entity('ObservedProperties', property_data)
-
 
 def create_datastream(
     name: str,
@@ -353,7 +394,7 @@ def create_datastream(
     datastream_data = {
         "name": name,
         "description": description,
-        "observationType": "http://www.opengis.net/def/observationType/OGC-OM/2.0/OM_Measurement",
+        "observationType": OM_MEASUREMENT,
         "unitOfMeasurement": unit_of_measurement,
         "Thing": {"@iot.id": thing_id},
         "Sensor": {"@iot.id": sensor_id},
@@ -367,13 +408,15 @@ def create_datastream(
 
 
 def get_all_things_with_locations(
-    client: Optional[HeFrostClient] = None
+    client: Optional[HeFrostClient] = None,
+    max_workers: int = 1
 ) -> Dict[str, Dict]:
     """
     Fetch all Things with their Locations expanded.
     Returns a dict keyed by Thing name for O(1) lookup.
     
     :param client: FROST client (uses default if None)
+    :param max_workers: Number of concurrent page requests (default 1, sequential)
     :return: Dict mapping Thing name to Thing data
     """
     if client is None:
@@ -384,7 +427,12 @@ def get_all_things_with_locations(
         return {}
 
     things_cache = {}
-    things = client.get_entities('Things', expand='Locations')
+    things = client.get_entities(
+        'Things',
+        select='@iot.id,name,properties',
+        expand='Locations($select=@iot.id,location)',
+        max_workers=max_workers
+    )
 
     if things:
         for thing in things:
@@ -424,78 +472,88 @@ def get_all_observed_properties(
     return obs_props_cache
 
 
-def prepare_thing_requests(
+def iter_thing_requests(
     thing_data: Dict,
-    things_cache: Dict[str, Dict],
-    request_id_counter: List[int]
-) -> Tuple[List[Dict], str]:
+    cached: Optional[Dict],
+    counter: Iterator[int],
+    name_to_ref: Optional[Dict[str, str]] = None
+) -> Iterator[Dict]:
     """
-    Prepare batch request operations for a Thing.
+    Yield batch request operations for a Thing.
+    The Thing data is consumed: its dicts are reused as request bodies and updated in place,
+    and the cached properties of existing Things are updated to the state being sent.
 
     :param thing_data: Thing data with name, Locations, Datastreams, properties
-    :param things_cache: Pre-fetched cache of existing Things
-    :param request_id_counter: Mutable counter [int] for unique request IDs
-    :return: Tuple of (list of batch request dicts, thing_id or reference)
+    :param cached: Pre-fetched cache entry of the Thing, None if it doesn't exist yet
+    :param counter: Shared counter (e.g. itertools.count(1)) for unique request IDs
+    :param name_to_ref: Optional dict filled with Thing name -> request id of new Things,
+        which can be referenced as "$<id>" by later requests of the same batch
+    :return: Iterator of batch request dicts
     """
-    thing_name = thing_data['name']
     new_location = thing_data['Locations'][0]['location']
-    batch_requests = []
-
-    def next_id():
-        request_id_counter[0] += 1
-        return str(request_id_counter[0])
 
-    if thing_name in things_cache:
+    if cached is not None:
         # Thing exists - prepare update operations
-        cached = things_cache[thing_name]
         thing_id = cached['id']
 
         # PATCH Thing to update state to operative
-        batch_requests.append({
-            "id": next_id(),
+        properties = cached.get('properties') or {}
+        properties['state'] = "operative"
+        cached['properties'] = properties
+        yield {
+            "id": str(next(counter)),
             "method": "patch",
             "url": f"Things({thing_id})",
-            "body": {"properties": {**cached.get('properties', {}), "state": "operative"}}
-        })
+            "body": {"properties": properties}
+        }
 
         # PATCH Location if geometry changed
         if cached['Locations']:
             old_location = cached['Locations'][0]
             if geometry_changed(old_location, new_location):
                 location_id = old_location['@iot.id']
-                batch_requests.append({
-                    "id": next_id(),
+                yield {
+                    "id": str(next(counter)),
                     "method": "patch",
                     "url": f"Locations({location_id})",
                     "body": {"location": new_location}
-                })
+                }
 
         # POST each Datastream to existing Thing
-        for ds in thing_data.get('Datastreams', []):
-            ds_copy = ds.copy()
-            ds_copy['Thing'] = {"@iot.id": thing_id}
-            batch_requests.append({
-                "id": next_id(),
+        thing_ref = {"@iot.id": thing_id}
+        for ds in thing_data.get('Datastreams', ()):
+            ds['Thing'] = thing_ref
+            yield {
+                "id": str(next(counter)),
                 "method": "post",
                 "url": "Datastreams",
-                "body": ds_copy
-            })
-
-        return batch_requests, thing_id
+                "body": ds
+            }
     else:
         # Thing doesn't exist - create with deep insert
-        thing_data_copy = thing_data.copy()
-        thing_data_copy['properties'] = {**thing_data_copy.get('properties', {}), "state": "operative"}
-
-        thing_ref = f"thing_{thing_name}"
-        batch_requests.append({
+        properties = thing_data.get('properties') or {}
+        properties['state'] = "operative"
+        body = {
+            "name": thing_data['name'],
+            "description": thing_data.get('description', ""),
+            "properties": properties,
+            "Locations": thing_data['Locations']
+        }
+        datastreams = thing_data.get('Datastreams')
+        if datastreams:
+            body["Datastreams"] = datastreams
+
+        # Compact numeric request id instead of the (possibly long) Thing name
+        thing_ref = str(next(counter))
+        if name_to_ref is not None:
+            name_to_ref[thing_data['name']] = thing_ref
+
+        yield {
             "id": thing_ref,
             "method": "post",
             "url": "Things",
-            "body": thing_data_copy
-        })
-
-        return batch_requests, f"${thing_ref}"
+            "body": body
+        }
 
 
 def process_things_batch(
@@ -509,6 +567,7 @@ def process_things_batch(
     Process multiple Things using batch requests with concurrent workers.
 
     :param things_data: List of Thing data dicts with name, Locations, Datastreams, properties
+        (consumed: the dicts are reused as request bodies)
     :param things_cache: Pre-fetched cache of existing Things (will fetch if None)
     :param batch_size: Maximum operations per batch request (default 50, keep low for deep inserts)
     :param max_workers: Number of concurrent batch requests (default 4)
@@ -527,41 +586,35 @@ def process_things_batch(
         tools_log.log_info("Fetching existing Things from FROST-Server...")
         things_cache = get_all_things_with_locations(client)
 
-    all_requests = []
-    request_id_counter = [0]
+    if not things_data:
+        tools_log.log_info("No requests to process")
+        return True
 
+    # Single cache probe per Thing, the entry is handed over to iter_thing_requests
+    thing_entries = []
     new_count = 0
-    update_count = 0
     total_datastreams = 0
-
-    tools_log.log_info(f"Preparing batch requests for {len(things_data)} Things...")
-    prep_start = time.time()
-
     for thing_data in things_data:
-        thing_name = thing_data['name']
-        is_new = thing_name not in things_cache
-
-        requests_for_thing, _ = prepare_thing_requests(thing_data, things_cache, request_id_counter)
-        all_requests.extend(requests_for_thing)
-        total_datastreams += len(thing_data.get('Datastreams', []))
-
-        if is_new:
+        cached = things_cache.get(thing_data['name'])
+        if cached is None:
             new_count += 1
-        else:
-            update_count += 1
-
-    prep_time = time.time() - prep_start
+        total_datastreams += len(thing_data.get('Datastreams', ()))
+        thing_entries.append((thing_data, cached))
+    update_count = len(things_data) - new_count
 
-    if not all_requests:
-        tools_log.log_info("No requests to process")
-        return True
-
-    num_batches = (len(all_requests) + batch_size - 1) // batch_size
-    tools_log.log_info(f"Prepared {len(all_requests)} operations in {prep_time:.2f}s")
+    tools_log.log_info(f"Preparing batch requests for {len(things_data)} Things...")
     tools_log.log_info(f"  Things: {new_count} new, {update_count} updates")
     tools_log.log_info(f"  Datastreams: {total_datastreams}")
-    tools_log.log_info(f"  Batches: {num_batches} (batch_size={batch_size}, max_workers={max_workers})")
-    tools_log.log_info("Sending batches...")
+    tools_log.log_info(f"  Batch size: {batch_size}, max_workers: {max_workers}")
+    tools_log.log_info("Streaming batches...")
+
+    # Requests are built lazily while earlier batches are being sent
+    request_id_counter = count(1)
+    name_to_ref = {}
+    all_requests = chain.from_iterable(
+        iter_thing_requests(thing_data, cached, request_id_counter, name_to_ref)
+        for thing_data, cached in thing_entries
+    )
 
     try:
         send_start = time.time()
@@ -577,20 +630,22 @@ def process_things_batch(
         success_count = sum(1 for r in responses if 200 <= r.get('status', 0) < 300)
         error_count = len(responses) - success_count
 
-        total_time = prep_time + send_time
-        ops_per_sec = len(all_requests) / send_time if send_time > 0 else 0
+        ops_per_sec = len(responses) / send_time if send_time > 0 else 0
 
         tools_log.log_info(f"Batch complete: {success_count} succeeded, {error_count} failed")
-        tools_log.log_info(f"  Send time: {send_time:.2f}s ({ops_per_sec:.1f} ops/sec)")
-        tools_log.log_info(f"  Total time: {total_time:.2f}s")
+        tools_log.log_info(f"  Total time: {send_time:.2f}s ({len(responses)} operations, {ops_per_sec:.1f} ops/sec)")
 
         # Log errors if any (limit to first 10)
         error_responses = [r for r in responses if r.get('status', 0) >= 400]
         if error_responses:
+            ref_to_name = {ref: name for name, ref in name_to_ref.items()}
             tools_log.log_warning(f"  First {min(10, len(error_responses))} errors:")
             for resp in error_responses[:10]:
                 error_msg = str(resp.get('body', ''))[:100]
-                tools_log.log_warning(f"    Request {resp.get('id')}: {resp.get('status')} - {error_msg}")
+                request_id = resp.get('id')
+                if request_id in ref_to_name:
+                    request_id = f"{request_id} (Thing {ref_to_name[request_id]})"
+                tools_log.log_warning(f"    Request {request_id}: {resp.get('status')} - {error_msg}")
 
         return error_count == 0
 
@@ -601,7 +656,7 @@ def process_things_batch(
 
 def mark_obsolete_things(
     things_cache: Dict[str, Dict],
-    active_feature_ids: set,
+    active_feature_ids: Union[Set[str], FrozenSet[str], Iterable[str]],
     batch_size: int = 100,
     max_workers: int = 4,
     client: Optional[HeFrostClient] = None
@@ -609,9 +664,10 @@ def mark_obsolete_things(
     """
     Mark Things not in the active feature set as obsolete using batch requests.
     Uses the pre-fetched cache, no additional queries needed.
+    The cached properties of the obsolete Things are updated in place.
     
     :param things_cache: Pre-fetched cache of existing Things
-    :param active_feature_ids: Set of active feature IDs (e.g., from INP file)
+    :param active_feature_ids: Set (or any iterable) of active feature IDs (e.g., from INP file)
     :param batch_size: Maximum operations per batch request
     :param max_workers: Number of concurrent batch requests (default 4)
     :param client: FROST client (uses default if None)
@@ -624,27 +680,32 @@ def mark_obsolete_things(
         tools_log.log_error("No FROST client available")
         return False
 
-    obsolete_things = []
-    for thing_name, thing_data in things_cache.items():
-        if thing_name not in active_feature_ids:
-            obsolete_things.append((thing_data['id'], thing_name, thing_data.get('properties', {})))
-
-    if not obsolete_things:
-        tools_log.log_info("No obsolete Things to mark")
-        return True
-
-    tools_log.log_info(f"Marking {len(obsolete_things)} Things as obsolete...")
+    # Guarantee O(1) membership checks whatever the caller passed
+    if not isinstance(active_feature_ids, (set, frozenset)):
+        active_feature_ids = frozenset(active_feature_ids)
 
-    # Build batch requests
+    # Build batch requests, updating the cached properties in place
     batch_requests = []
-    for i, (thing_id, thing_name, properties) in enumerate(obsolete_things):
+    request_ids = map(str, count())
+    for thing_name, thing_data in things_cache.items():
+        if thing_name in active_feature_ids:
+            continue
+        properties = thing_data.get('properties') or {}
+        properties['state'] = "obsolete"
+        thing_data['properties'] = properties
         batch_requests.append({
-            "id": str(i),
+            "id": next(request_ids),
             "method": "patch",
-            "url": f"Things({thing_id})",
-            "body": {"properties": {**properties, "state": "obsolete"}}
+            "url": f"Things({thing_data['id']})",
+            "body": {"properties": properties}
         })
 
+    if not batch_requests:
+        tools_log.log_info("No obsolete Things to mark")
+        return True
+
+    tools_log.log_info(f"Marking {len(batch_requests)} Things as obsolete...")
+
     try:
         responses = client.batch_request(batch_requests, batch_size, max_workers)
 
@@ -654,7 +715,7 @@ def mark_obsolete_things(
 
         success_count = sum(1 for r in responses if 200 <= r.get('status', 0) < 300)
         tools_log.log_info(f"Marked {success_count} Things as obsolete")
-        return success_count == len(obsolete_things)
+        return success_count == len(batch_requests)
 
     except Exception as e:
         tools_log.log_error(f"Error marking Things as obsolete: {e}")
@@ -695,13 +756,10 @@ def delete_all_entities(
             entity_ids = [item['@iot.id'] for item in all_entities]
 
             # Build batch delete requests
-            delete_requests = []
-            for i, entity_id in enumerate(entity_ids):
-                delete_requests.append({
-                    "id": str(i),
-                    "method": "delete",
-                    "url": f"{entity}({entity_id})"
-                })
+            delete_requests = [
+                {"id": request_id, "method": "delete", "url": f"{entity}({entity_id})"}
+                for request_id, entity_id in zip(map(str, range(len(entity_ids))), entity_ids)
+            ]
 
             # Send batch delete
             tools_log.log_info(f"Deleting {len(entity_ids)} {entity} using batch requests...")
@@ -728,41 +786,106 @@ def get_or_create_observed_properties(
 ) -> Dict[str, str]:
     """
     Get or create observed properties using the pre-fetched cache.
-    Only creates properties that don't already exist.
+    Only creates properties that don't already exist, all of them in a single batch request.
     Returns a dict mapping property keys to IDs.
     """
     property_ids = {}
+    prop_configs = _PROP_CONFIG[engine]
+    to_create = []
 
-    for prop_key in set(get_node_properties(engine) + get_link_properties(engine)):
-        prop_config = get_observed_property_config(prop_key, engine)
+    for prop_key in _ALL_PROPS[engine]:
+        prop_config = prop_configs[prop_key]
         prop_name = prop_config['name']
 
         if prop_name in obs_props_cache:
             # Use existing property
             property_ids[prop_key] = obs_props_cache[prop_name]
-            tools_log.log_info(f"Using existing ObservedProperty: {prop_name}")
+            tools_log.log_debug(f"Using existing ObservedProperty: {prop_name}")
         else:
-            # Create new property
-            prop_url = create_observed_property(
-                prop_name,
-                prop_config['description'],
-                prop_config['unit_symbol'],
-                client=client
-            )
-            property_ids[prop_key] = get_entity_id(prop_url)
-            tools_log.log_info(f"Created ObservedProperty: {prop_name}")
+            # Queue new property, the property key doubles as batch request id
+            to_create.append({
+                "id": prop_key,
+                "method": "post",
+                "url": "ObservedProperties",
+                "body": _observed_property_data(prop_name, prop_config['description'])
+            })
+
+    reused_count = len(property_ids)
+    if not to_create:
+        tools_log.log_info(f"ObservedProperties: {reused_count} reused, 0 created")
+        return property_ids
+
+    if client is None:
+        client = get_api_client()
 
+    if not client or not isinstance(client, HeFrostClient):
+        tools_log.log_error("No FROST client available")
+        _log_missing_properties(property_ids, engine)
+        return property_ids
+
+    responses = client.batch_request(to_create, batch_size=50, max_workers=1)
+    if responses is None:
+        tools_log.log_error("Failed to create ObservedProperties")
+        _log_missing_properties(property_ids, engine)
+        return property_ids
+
+    for resp in responses:
+        prop_key = resp.get('id')
+        if prop_key not in prop_configs:
+            tools_log.log_warning(f"Skipping batch response with unknown id: {prop_key}")
+            continue
+        prop_name = prop_configs[prop_key]['name']
+        if not 200 <= resp.get('status', 0) < 300:
+            tools_log.log_error(f"Error creating ObservedProperty {prop_name}: {resp.get('status')}")
+            continue
+        location = resp.get('location')
+        if location:
+            entity_id = get_entity_id(location)
+        else:
+            entity_id = (resp.get('body') or {}).get('@iot.id')
+        if entity_id is None:
+            tools_log.log_warning(f"No id returned for created ObservedProperty: {prop_name}")
+            continue
+        property_ids[prop_key] = str(entity_id)
+        tools_log.log_debug(f"Created ObservedProperty: {prop_name}")
+
+    created_count = len(property_ids) - reused_count
+    tools_log.log_info(
+        f"ObservedProperties: {reused_count} reused, {created_count} created, "
+        f"{len(to_create) - created_count} failed"
+    )
+    _log_missing_properties(property_ids, engine)
     return property_ids
 
 
+def _log_missing_properties(property_ids: Dict[str, str], engine: Literal['swmm', 'epanet']) -> None:
+    """Log once the property keys left without an ObservedProperty id, whose Datastreams are skipped."""
+    missing = [prop_key for prop_key in _ALL_PROPS[engine] if prop_key not in property_ids]
+    if missing:
+        tools_log.log_warning(
+            f"No ObservedProperty available for {', '.join(missing)}: their Datastreams will be skipped"
+        )
+
+
 def create_simulation_sensor(
     result_id: str,
     network_type: Literal['EPANET', 'SWMM'],
     inp_file: str,
-    client: Optional[HeFrostClient] = None
+    client: Optional[HeFrostClient] = None,
+    inp_filename: Optional[str] = None
 ) -> Dict[str, str]:
-    """Create a new sensor for this simulation run."""
-    inp_filename = os.path.basename(inp_file)
+    """
+    Create a new sensor for this simulation run.
+
+    :param result_id: Result identifier of the simulation run
+    :param network_type: Network type ('EPANET' or 'SWMM')
+    :param inp_file: Path of the INP file used for the run
+    :param client: FROST client (uses default if None)
+    :param inp_filename: Base name of inp_file, if already known by the caller
+    :return: Dict mapping 'simulated' to the Sensor ID
+    """
+    if inp_filename is None:
+        inp_filename = os.path.basename(inp_file)
 
     sensor_properties = {
         "simulated": True,
@@ -798,15 +921,28 @@ def get_swmm_node_type(node: str, inp_data: SwmmInput) -> str:
     return node_type
 
 
+def build_swmm_node_type_index(inp_data: SwmmInput) -> Dict[str, str]:
+    """
+    Build a node -> type index walking each SWMM node section once.
+    Look nodes up with index.get(node, 'JUNCTION'), same result as get_swmm_node_type.
+
+    :param inp_data: SWMM input data
+    :return: Dict mapping node name to node type
+    """
+    index = {}
+    for section, node_type in _SWMM_NODE_TYPE_SECTIONS:
+        if section in inp_data:
+            index.update(dict.fromkeys(inp_data[section], node_type))
+    return index
+
+
 def get_epanet_node_type(node: wntr.network.Node) -> str:
     """Get the type of a EPANET node from the input data."""
-    if isinstance(node, wntr.network.Junction):
-        return 'JUNCTION'
-    elif isinstance(node, wntr.network.Reservoir):
-        return 'RESERVOIR'
-    elif isinstance(node, wntr.network.Tank):
-        return 'TANK'
-    return 'UNKNOWN'
+    node_class = type(node)
+    node_type = _EPANET_NODE_TYPE.get(node_class)
+    if node_type is None:
+        node_type = _resolve_epanet_type(node_class, _EPANET_NODE_TYPE)
+    return node_type
 
 
 def get_swmm_link_type(link: str, inp_data: SwmmInput) -> str:
@@ -824,12 +960,36 @@ def get_swmm_link_type(link: str, inp_data: SwmmInput) -> str:
     return link_type
 
 
+def build_swmm_link_type_index(inp_data: SwmmInput) -> Dict[str, str]:
+    """
+    Build a link -> type index walking each SWMM link section once.
+    Look links up with index.get(link, 'CONDUIT'), same result as get_swmm_link_type.
+
+    :param inp_data: SWMM input data
+    :return: Dict mapping link name to link type
+    """
+    index = {}
+    for section, link_type in _SWMM_LINK_TYPE_SECTIONS:
+        if section in inp_data:
+            index.update(dict.fromkeys(inp_data[section], link_type))
+    return index
+
+
 def get_epanet_link_type(link: wntr.network.Link) -> str:
     """Get the type of a EPANET link from the input data."""
-    if isinstance(link, wntr.network.Pipe):
-        return 'PIPE'
-    elif isinstance(link, wntr.network.Pump):
-        return 'PUMP'
-    elif isinstance(link, wntr.network.Valve):
-        return 'VALVE'
-    return 'UNKNOWN'
+    link_class = type(link)
+    link_type = _EPANET_LINK_TYPE.get(link_class)
+    if link_type is None:
+        link_type = _resolve_epanet_type(link_class, _EPANET_LINK_TYPE)
+    return link_type
+
+
+def _resolve_epanet_type(element_class: type, type_map: Dict[type, str]) -> str:
+    """Resolve a wntr subclass (e.g. PRValve) against a class -> type map and cache the result."""
+    element_type = 'UNKNOWN'
+    for base_class, base_type in list(type_map.items()):
+        if issubclass(element_class, base_class):
+            element_type = base_type
+            break
+    type_map[element_class] = element_type
+    return element_type
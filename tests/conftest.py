@@ -8,8 +8,34 @@ Pytest configuration and fixtures.
 """
 # -*- coding: utf-8 -*-
 import os
+import uuid
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
+
+
+@pytest.fixture(scope="session")
+def he():
+    """Return the hydraulic_engine package, imported once per test session."""
+    import hydraulic_engine
+    return hydraulic_engine
+
+
+@pytest.fixture(scope="session")
+def db_api(he) -> SimpleNamespace:
+    """Return the database connection factory functions, resolved once per test session."""
+    return SimpleNamespace(
+        create_sqlite_connection=he.create_sqlite_connection,
+        create_gpkg_connection=he.create_gpkg_connection,
+        get_connection=he.get_connection,
+        close_connection=he.close_connection,
+    )
+
+
+@pytest.fixture
+def mem_db() -> str:
+    """Return a URI to an isolated, shared-cache in-memory SQLite database."""
+    return f"file:mem{uuid.uuid4().hex}?mode=memory&cache=shared"
 
 
 @pytest.fixture
@@ -9,6 +9,7 @@ Connection tests.
 # -*- coding: utf-8 -*-
 import os
 import tempfile
+import time
 import pytest
 
 
@@ -49,36 +50,31 @@ class TestConnectionImports:
 class TestSqliteConnection:
     """Test SQLite connection functionality."""
 
-    def test_create_sqlite_connection(self, tmp_path):
+    def test_create_sqlite_connection(self, db_api, mem_db):
         """Test creating a SQLite connection."""
-        from hydraulic_engine import create_sqlite_connection, get_connection, close_connection
-
-        db_path = str(tmp_path / "test.db")
 
         # Create connection
-        dao = create_sqlite_connection(db_path, set_as_default=True)
+        dao = db_api.create_sqlite_connection(mem_db, set_as_default=True)
         assert dao is not None
         assert dao.is_connected()
+        assert dao.is_connected(probe=True)
 
         # Check it's set as default
-        assert get_connection() is dao
+        assert db_api.get_connection() is dao
 
         # Close connection
-        close_connection()
-        assert get_connection() is None
+        db_api.close_connection()
+        assert db_api.get_connection() is None
 
-    def test_sqlite_execute_and_query(self, tmp_path):
+    def test_sqlite_execute_and_query(self, db_api, mem_db):
         """Test SQLite execute and query operations."""
-        from hydraulic_engine import create_sqlite_connection, close_connection
-
-        db_path = str(tmp_path / "test.db")
-        dao = create_sqlite_connection(db_path)
+        dao = db_api.create_sqlite_connection(mem_db)
 
-        # Create table
-        assert dao.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
-
-        # Insert data
-        assert dao.execute("INSERT INTO test (name) VALUES (?)", ("test_value",))
+        # Create table and insert data in a single transaction
+        with dao.transaction():
+            assert dao.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+            assert dao.execute_many("INSERT INTO test (name) VALUES (?)", [("test_value",), ("test_value_2",)])
+        assert not dao.conn.in_transaction
 
         # Query data
         row = dao.get_row("SELECT * FROM test WHERE name = ?", ("test_value",))
@@ -86,41 +82,174 @@ class TestSqliteConnection:
         assert row[1] == "test_value"
 
         # Query multiple rows
-        dao.execute("INSERT INTO test (name) VALUES (?)", ("test_value_2",))
         rows = dao.get_rows("SELECT * FROM test")
         assert rows is not None
         assert len(rows) == 2
 
-        close_connection()
+        db_api.close_connection()
+
+    def test_sqlite_get_rows_dict(self, db_api, mem_db):
+        """Test SQLite rows returned as dictionaries keyed by column name."""
+        dao = db_api.create_sqlite_connection(mem_db)
+        dao.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        dao.execute_many("INSERT INTO test (id, name) VALUES (?, ?)", [(1, "a"), (2, "b")])
+
+        rows = dao.get_rows_dict("SELECT id, name AS label FROM test ORDER BY id")
+        assert rows == [{"id": 1, "label": "a"}, {"id": 2, "label": "b"}]
+        assert dao.get_rows_dict("SELECT id FROM test WHERE id > ?", (5,)) == []
+        assert dao.get_rows_dict("SELECT * FROM missing_table") is None
+
+        db_api.close_connection()
+
+    def test_sqlite_execute_many(self, db_api, mem_db):
+        """Test SQLite bulk insert and update operations."""
+        dao = db_api.create_sqlite_connection(mem_db)
+        dao.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+
+        # Multi-row INSERT spanning several statements
+        records = [(i, f"value_{i}") for i in range(1200)]
+        assert dao.execute_many("INSERT INTO test (id, name) VALUES (?, ?)", records)
+        row = dao.get_row("SELECT COUNT(*), MAX(id) FROM test")
+        assert row[0] == 1200
+        assert row[1] == 1199
+
+        # Non-INSERT statements fall back to executemany
+        assert dao.execute_many("UPDATE test SET name = ? WHERE id = ?", [("updated", 0), ("updated", 1)])
+        row = dao.get_row("SELECT COUNT(*) FROM test WHERE name = ?", ("updated",))
+        assert row[0] == 2
+
+        db_api.close_connection()
+
+    def test_sqlite_execute_many_not_rewritten(self, db_api, mem_db):
+        """Test INSERT statements that can't be turned into multi-row inserts still work."""
+        dao = db_api.create_sqlite_connection(mem_db)
+        dao.execute("CREATE TABLE test (a INTEGER PRIMARY KEY, b TEXT)")
+
+        # Numbered placeholders reuse a parameter
+        assert dao.execute_many("INSERT INTO test (a, b) VALUES (?1, ?1)", [(1,), (2,)])
+        assert [tuple(row) for row in dao.get_rows("SELECT a, b FROM test ORDER BY a")] == [(1, "1"), (2, "2")]
+
+        # Upsert with an extra parameter after VALUES
+        sql = "INSERT INTO test (a, b) VALUES (?, ?) ON CONFLICT(a) DO UPDATE SET b = coalesce(excluded.b, ?)"
+        assert dao.execute_many(sql, [(1, None, "kept"), (2, "new", "unused"), (3, "x", "y")])
+        assert [tuple(row) for row in dao.get_rows("SELECT a, b FROM test ORDER BY a")] == [(1, "kept"), (2, "new"), (3, "x")]
+
+        # '?' inside a string literal is not a parameter
+        assert dao.execute_many("INSERT INTO test (a, b) VALUES (?, '?')", [(4,), (5,)])
+        assert dao.get_row("SELECT COUNT(*) FROM test WHERE b = '?'")[0] == 2
+
+        # A row with the wrong number of values is an error, not shifted into the next rows
+        assert dao.execute_many("INSERT INTO test (a, b) VALUES (?, ?)", [(10, "x"), (11,), (12, 13, "z")]) is False
+        assert dao.get_row("SELECT COUNT(*) FROM test WHERE a >= 10")[0] == 0
+
+        db_api.close_connection()
+
+    def test_sqlite_transaction_rollback(self, db_api, mem_db):
+        """Test that a failing transaction block is rolled back."""
+        dao = db_api.create_sqlite_connection(mem_db)
+        dao.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+
+        with pytest.raises(RuntimeError):
+            with dao.transaction():
+                dao.execute("INSERT INTO test (name) VALUES (?)", ("discarded",))
+                raise RuntimeError("abort")
+
+        row = dao.get_row("SELECT COUNT(*) FROM test")
+        assert row[0] == 0
+
+        db_api.close_connection()
+
+    def test_sqlite_transaction_failed_statement(self, db_api, mem_db):
+        """Test that a failing statement inside a transaction rolls the whole block back."""
+        dao = db_api.create_sqlite_connection(mem_db)
+        dao.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+
+        with dao.transaction():
+            assert dao.execute("INSERT INTO test (id, name) VALUES (?, ?)", (1, "first"))
+            assert dao.execute("INSERT INTO test (id, name) VALUES (?, ?)", (1, "duplicate")) is False
+            # Later statements are skipped instead of being committed on their own
+            assert dao.execute_many("INSERT INTO test (id, name) VALUES (?, ?)", [(2, "second")]) is False
+        assert not dao.conn.in_transaction
+
+        row = dao.get_row("SELECT COUNT(*) FROM test")
+        assert row[0] == 0
+
+        # The DAO is usable again after the failed transaction
+        assert dao.execute("INSERT INTO test (id, name) VALUES (?, ?)", (1, "first"))
+        assert dao.get_row("SELECT COUNT(*) FROM test")[0] == 1
+
+        db_api.close_connection()
+
+    def test_sqlite_connection_pool(self, db_api, tmp_path):
+        """Test that pooled SQLite connections are reused after close."""
+        from hydraulic_engine.utils import clear_sqlite_pool
+
+        db_path = tmp_path / "test.db"
+        dao = db_api.create_sqlite_connection(db_path, pool_size=2)
+        conn = dao.conn
+        db_api.close_connection()
+
+        # Same underlying connection is handed out again
+        dao = db_api.create_sqlite_connection(db_path, pool_size=2)
+        assert dao.conn is conn
+        assert dao.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+
+        db_api.close_connection()
+        clear_sqlite_pool()
+
+    def test_sqlite_pool_key_fast_mode(self, db_api, tmp_path):
+        """Test that pooled connections are not handed out across fast_mode settings."""
+        from hydraulic_engine.utils import clear_sqlite_pool
+
+        db_path = tmp_path / "test.db"
+        dao = db_api.create_sqlite_connection(db_path, pool_size=2, fast_mode=True)
+        conn = dao.conn
+        db_api.close_connection()
+
+        dao = db_api.create_sqlite_connection(db_path, pool_size=2)
+        assert dao.conn is not conn
+        assert dao.get_row("PRAGMA synchronous")[0] == 2  # FULL
+
+        db_api.close_connection()
+        clear_sqlite_pool()
 
 
 class TestGpkgConnection:
     """Test GeoPackage connection functionality."""
 
-    def test_create_gpkg_connection(self, tmp_path):
+    def test_create_gpkg_connection(self, db_api, tmp_path):
         """Test creating a GeoPackage connection."""
-        from hydraulic_engine import create_gpkg_connection, get_connection, close_connection
-
-        gpkg_path = str(tmp_path / "test.gpkg")
+        gpkg_path = tmp_path / "test.gpkg"
 
         # Create connection (this will create the file)
-        dao = create_gpkg_connection(gpkg_path, set_as_default=True)
+        dao = db_api.create_gpkg_connection(gpkg_path, set_as_default=True)
         assert dao is not None
         assert dao.is_connected()
 
         # Check it's set as default
-        assert get_connection() is dao
+        assert db_api.get_connection() is dao
 
         # Close connection
-        close_connection()
-        assert get_connection() is None
+        db_api.close_connection()
+        assert db_api.get_connection() is None
+
+    def test_gpkg_default_journal_mode(self, db_api, tmp_path):
+        """Test GeoPackages keep the rollback journal unless fast_mode is requested."""
+        gpkg_path = tmp_path / "test.gpkg"
+        dao = db_api.create_gpkg_connection(gpkg_path, set_as_default=False)
+        dao.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        assert dao.get_row("PRAGMA journal_mode")[0] == "delete"
+        dao.close_db()
+        assert not os.path.exists(f"{gpkg_path}-wal")
 
-    def test_gpkg_clone(self, tmp_path):
-        """Test GeoPackage DAO cloning."""
-        from hydraulic_engine import create_gpkg_connection, close_connection
+        dao = db_api.create_gpkg_connection(gpkg_path, set_as_default=False, fast_mode=True)
+        assert dao.get_row("PRAGMA journal_mode")[0] == "wal"
+        dao.close_db()
 
-        gpkg_path = str(tmp_path / "test.gpkg")
-        dao = create_gpkg_connection(gpkg_path, set_as_default=False)
+    def test_gpkg_clone(self, db_api, tmp_path):
+        """Test GeoPackage DAO cloning."""
+        gpkg_path = tmp_path / "test.gpkg"
+        dao = db_api.create_gpkg_connection(gpkg_path, set_as_default=False)
 
         # Clone the DAO
         cloned_dao = dao.clone()
@@ -131,6 +260,44 @@ class TestGpkgConnection:
         dao.close_db()
         cloned_dao.close_db()
 
+    def test_gpkg_read_only_clone(self, db_api, tmp_path):
+        """Test read-only GeoPackage DAO clones see writes but can't write."""
+        gpkg_path = tmp_path / "test.gpkg"
+        dao = db_api.create_gpkg_connection(gpkg_path, set_as_default=False)
+        dao.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+
+        reader = dao.clone(read_only=True)
+        assert reader.is_connected()
+        dao.execute("INSERT INTO test (id) VALUES (1)")
+        assert reader.get_row("SELECT COUNT(*) FROM test")[0] == 1
+        assert reader.execute("INSERT INTO test (id) VALUES (2)") is False
+
+        reader.close_db()
+        dao.close_db()
+
+
+class TestSqlNormalization:
+    """Test SQL text normalization used by the PostgreSQL DAO."""
+
+    def test_escape_string_literal_kept(self):
+        """Test E'...' literals with backslash escapes are not cut at an embedded '--'."""
+        from hydraulic_engine.utils.tools_db import _normalize_sql
+        sql = "select E'it\\'s -- not comment' as x"
+        assert _normalize_sql(sql) == sql
+
+    def test_newline_between_literals_kept(self):
+        """Test whitespace runs spanning lines collapse to a newline, not a space."""
+        from hydraulic_engine.utils.tools_db import _normalize_sql
+        assert _normalize_sql("select 'a'\n'b'") == "select 'a'\n'b'"
+        assert _normalize_sql("select  1 /* c */ ,\t2 -- x\n  from t") == "select 1 , 2\nfrom t"
+
+    def test_composable_passed_through(self):
+        """Test psycopg.sql.Composable statements are returned untouched."""
+        psycopg_sql = pytest.importorskip("psycopg.sql")
+        from hydraulic_engine.utils.tools_db import _normalize_sql
+        query = psycopg_sql.SQL("select {}").format(psycopg_sql.Identifier("a"))
+        assert _normalize_sql(query) is query
+
 
 class TestPgConnection:
     """Test PostgreSQL connection functionality (requires running PostgreSQL)."""
@@ -160,6 +327,243 @@ class TestPgConnection:
         assert get_connection() is None
 
 
+class _FakePgConnection:
+    """
+    Minimal stand-in for a psycopg connection, tracking its transaction status, the statements
+    it ran and a transactional search_path setting.
+    """
+
+    def __init__(self):
+        from psycopg.pq import TransactionStatus
+        self._status = TransactionStatus
+        self.info = type("Info", (), {"transaction_status": TransactionStatus.IDLE})()
+        self.closed = False
+        self.broken = False
+        self.statements = []
+        self.search_path = '"$user", public'
+        self._committed_search_path = self.search_path
+        self._last = None
+
+    def _run(self, query):
+        import psycopg
+        if self.broken:
+            raise psycopg.OperationalError("server closed the connection unexpectedly")
+        self.statements.append(query)
+        self.info.transaction_status = self._status.INTRANS
+        if query.startswith("SET search_path TO "):
+            self.search_path = query[len("SET search_path TO "):]
+            self._last = None
+        elif query == "SHOW search_path":
+            self._last = (self.search_path,)
+        else:
+            self._last = (1,)
+
+    def cursor(self, **kwargs):
+        conn = self
+
+        class _Cursor:
+            def execute(self, query, params=None):
+                conn._run(query)
+
+            def fetchall(self):
+                return [conn._last]
+
+            def fetchone(self):
+                return conn._last
+
+            def close(self):
+                pass
+
+        return _Cursor()
+
+    def execute(self, query, params=None):
+        self._run(query)
+
+    def commit(self):
+        self._committed_search_path = self.search_path
+        self.info.transaction_status = self._status.IDLE
+
+    def rollback(self):
+        self.search_path = self._committed_search_path
+        self.info.transaction_status = self._status.IDLE
+
+    def close(self):
+        self.closed = True
+
+
+class TestPgConnectionChecks:
+    """Test PostgreSQL connection recycling and pre-ping without a server."""
+
+    @pytest.fixture
+    def pg_dao(self, monkeypatch):
+        pytest.importorskip("psycopg")
+        from hydraulic_engine.utils.tools_db import HePgDao
+
+        def fake_connect(self, **kwargs):
+            self._connection_params = kwargs
+            self.conn = _FakePgConnection()
+            self.cursor = self.conn.cursor()
+            self._connected_at = time.monotonic()
+            return True
+
+        monkeypatch.setattr(HePgDao, "connect", fake_connect)
+        return HePgDao
+
+    def test_recycle_after_commit(self, pg_dao):
+        """Test an expired connection left in a transaction by a read is recycled on commit."""
+        dao = pg_dao(pool_recycle=60)
+        dao.connect(dbname="test")
+        old_conn = dao.conn
+
+        # A read opens a transaction that stays open while the connection expires
+        assert dao.get_row("SELECT 1") is not None
+        dao._connected_at -= 120
+        assert dao.get_row("SELECT 1") is not None
+        assert dao.conn is old_conn
+
+        assert dao.commit()
+        assert dao.conn is not old_conn
+        assert old_conn.closed
+
+    def test_recycle_before_statement(self, pg_dao):
+        """Test an expired idle connection is recycled before the next statement."""
+        dao = pg_dao(pool_recycle=60)
+        dao.connect(dbname="test")
+        old_conn = dao.conn
+        dao._connected_at -= 120
+
+        assert dao.execute("UPDATE t SET a = 1")
+        assert dao.conn is not old_conn
+        assert old_conn.closed
+
+    def test_broken_in_transaction_fails(self, pg_dao):
+        """Test a connection lost mid-transaction fails the statement instead of reconnecting."""
+        dao = pg_dao(pool_recycle=60)
+        dao.connect(dbname="test")
+        old_conn = dao.conn
+        assert dao.execute("INSERT INTO t VALUES (1)", commit=False)
+        old_conn.broken = True
+
+        # Reads keep failing on the broken connection until the caller ends the transaction
+        assert dao.get_row("SELECT a FROM t") is None
+        assert dao.conn is old_conn
+        assert "transaction open" in dao.last_error
+
+        # The failed statement is not re-executed on a new connection...
+        assert dao.execute("INSERT INTO t VALUES (2)", commit=False) is False
+        assert "INSERT INTO t VALUES (2)" not in old_conn.statements
+        assert "INSERT INTO t VALUES (2)" not in dao.conn.statements
+
+        # ...and the rollback done by the failed execute reconnects with an empty transaction
+        assert dao.conn is not old_conn
+        assert dao.execute("INSERT INTO t VALUES (3)")
+        assert dao.conn.statements == ["INSERT INTO t VALUES (3)"]
+
+    def test_broken_idle_reconnects(self, pg_dao):
+        """Test a connection lost between transactions is rebuilt before the next statement."""
+        dao = pg_dao(pool_recycle=60)
+        dao.connect(dbname="test")
+        old_conn = dao.conn
+        assert dao.execute("INSERT INTO t VALUES (1)")
+        old_conn.broken = True
+
+        assert dao.execute("INSERT INTO t VALUES (2)")
+        assert dao.conn is not old_conn
+        assert dao.conn.statements == ["INSERT INTO t VALUES (2)"]
+
+    def test_pre_ping_keeps_connection_idle(self, pg_dao):
+        """Test the pre-ping query doesn't leave a transaction open."""
+        from psycopg.pq import TransactionStatus
+        dao = pg_dao(pre_ping=True, pool_recycle=None)
+        dao.connect(dbname="test")
+        dao._check_connection()
+        assert dao.conn.info.transaction_status == TransactionStatus.IDLE
+
+
+class TestPgConnectionPool:
+    """Test PostgreSQL connection pooling without a server."""
+
+    @pytest.fixture
+    def pg_dao(self, monkeypatch):
+        psycopg = pytest.importorskip("psycopg")
+        from hydraulic_engine.utils import clear_pg_pool
+        from hydraulic_engine.utils.tools_db import HePgDao
+
+        monkeypatch.setattr(psycopg, "connect", lambda conninfo, **kwargs: _FakePgConnection())
+        yield HePgDao
+        clear_pg_pool()
+
+    def test_pooled_connection_reused(self, pg_dao):
+        """Test a closed DAO hands its connection to the next one with the same parameters."""
+        dao = pg_dao(pool_size=2)
+        assert dao.connect(dbname="test", user="he")
+        conn = dao.conn
+        dao.close_db()
+        assert not conn.closed
+
+        dao = pg_dao(pool_size=2)
+        dao.connect(dbname="test", user="he")
+        assert dao.conn is conn
+
+        # Another schema means another search_path: not shared
+        other = pg_dao(pool_size=2)
+        other.connect(dbname="test", user="he", schema="ws")
+        assert other.conn is not conn
+
+        dao.close_db()
+        other.close_db()
+
+    def test_pooled_connection_keeps_schema(self, pg_dao):
+        """Test a pooled connection keeps its search_path after an uncommitted close."""
+        dao = pg_dao(pool_size=1)
+        dao.connect(dbname="test", schema="ws")
+        conn = dao.conn
+        dao.execute("UPDATE t SET a = 1", commit=False)
+        dao.close_db()
+
+        dao = pg_dao(pool_size=1)
+        dao.connect(dbname="test", schema="ws")
+        assert dao.conn is conn
+        assert dao.get_row("SHOW search_path")[0] == "ws, public"
+        dao.close_db()
+
+    def test_checkin_rolls_back_open_transaction(self, pg_dao):
+        """Test a connection is returned to the pool without its open transaction."""
+        from psycopg.pq import TransactionStatus
+        dao = pg_dao(pool_size=1)
+        dao.connect(dbname="test")
+        conn = dao.conn
+        dao.execute("UPDATE t SET a = 1", commit=False)
+        assert conn.info.transaction_status == TransactionStatus.INTRANS
+        dao.close_db()
+        assert conn.info.transaction_status == TransactionStatus.IDLE
+
+    def test_expired_pooled_connection_discarded(self, pg_dao):
+        """Test pooled connections older than pool_recycle are closed instead of reused."""
+        dao = pg_dao(pool_size=1, pool_recycle=60)
+        dao.connect(dbname="test")
+        conn = dao.conn
+        dao._connected_at -= 120
+        dao.close_db()
+
+        dao = pg_dao(pool_size=1, pool_recycle=60)
+        dao.connect(dbname="test")
+        assert dao.conn is not conn
+        assert conn.closed
+        dao.close_db()
+
+    def test_clear_pg_pool(self, pg_dao):
+        """Test clear_pg_pool closes idle connections."""
+        from hydraulic_engine.utils import clear_pg_pool
+        dao = pg_dao(pool_size=1)
+        dao.connect(dbname="test")
+        conn = dao.conn
+        dao.close_db()
+
+        clear_pg_pool()
+        assert conn.closed
+
+
 class TestConnectionWithActions:
     """Test that actions use the global connection."""
 
@@ -168,7 +572,7 @@ class TestConnectionWithActions:
         from hydraulic_engine import create_sqlite_connection, get_connection, close_connection
         from hydraulic_engine.core.actions import ImportRpt, ExportInp
 
-        db_path = str(tmp_path / "test.db")
+        db_path = tmp_path / "test.db"
         dao = create_sqlite_connection(db_path, set_as_default=True)
 
         # Create actions without passing DAO
@@ -34,70 +34,6 @@ class TestEpanetImports:
         assert EpanetRunStatus is not None
 
 
-class TestEpanetRunner:
-    """Test EpanetRunner class."""
-
-    def test_runner_initialization(self):
-        """Test EpanetRunner can be initialized."""
-        from hydraulic_engine import EpanetRunner
-        runner = EpanetRunner()
-        assert runner is not None
-
-    def test_run_missing_file(self):
-        """Test running with missing INP file."""
-        from hydraulic_engine import EpanetRunner
-        from hydraulic_engine.core.epanet.runner import EpanetRunStatus
-        
-        runner = EpanetRunner()
-        result = runner.run("nonexistent.inp")
-        
-        assert result.status == EpanetRunStatus.ERROR
-        assert len(result.errors) > 0
-
-    def test_validate_missing_file(self):
-        """Test validating missing INP file."""
-        from hydraulic_engine import EpanetRunner
-        
-        runner = EpanetRunner()
-        validation = runner.validate_inp("nonexistent.inp")
-        
-        assert validation["valid"] is False
-        assert len(validation["errors"]) > 0
-
-
-class TestEpanetInpHandler:
-    """Test EpanetInpHandler class."""
-
-    def test_handler_initialization(self):
-        """Test EpanetInpHandler can be initialized."""
-        from hydraulic_engine import EpanetInpHandler
-        handler = EpanetInpHandler()
-        assert handler is not None
-        assert handler.inp_path is None
-        assert handler.wn is None
-
-    def test_is_loaded_false(self):
-        """Test is_loaded returns False when no file loaded."""
-        from hydraulic_engine import EpanetInpHandler
-        handler = EpanetInpHandler()
-        assert handler.is_loaded() is False
-
-    def test_read_missing_file(self):
-        """Test reading missing file."""
-        from hydraulic_engine import EpanetInpHandler
-        handler = EpanetInpHandler()
-        result = handler.read("nonexistent.inp")
-        assert result is False
-        assert handler.error_msg is not None
-
-    def test_get_summary_not_loaded(self):
-        """Test get_summary when no file loaded."""
-        from hydraulic_engine import EpanetInpHandler
-        handler = EpanetInpHandler()
-        summary = handler.get_summary()
-        assert summary["loaded"] is False
-
-
 class TestEpanetRptHandler:
     """Test EpanetRptHandler class."""
 
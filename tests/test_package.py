@@ -57,3 +57,60 @@ class TestConfig:
         assert config.package_dir == "/test/path"
         assert config.package_name == "test_package"
         assert config.user_folder_dir == "/test/user"
+
+
+class TestLogger:
+    """Test HeLogger file handling."""
+
+    @pytest.fixture
+    def log_dir(self, tmp_path, monkeypatch):
+        from hydraulic_engine.utils import tools_os
+        monkeypatch.setattr(tools_os, "_DATADIR", str(tmp_path))
+        return tmp_path
+
+    def test_shared_file_handler(self, log_dir):
+        """Test that loggers on the same file share one handler, closed only by its last owner."""
+        from hydraulic_engine.utils.tools_log import HeLogger
+        first = HeLogger("test_shared", 10, "%Y%m%d", file_has_tstamp=False)
+        second = HeLogger("test_shared", 10, "%Y%m%d", file_has_tstamp=False)
+        handler = first.fh
+        assert second.fh is handler
+
+        first.close_logger()
+        assert handler in second.logger_file.handlers
+        second.info("still open")
+        with open(second.filepath, encoding="utf-8") as f:
+            assert "still open" in f.read()
+
+        second.close_logger()
+        assert handler not in second.logger_file.handlers
+        assert handler.fd is None
+
+    def test_remove_previous_reopens_handler(self, log_dir):
+        """Test that a removed log file is recreated instead of writing to the unlinked one."""
+        from hydraulic_engine.utils.tools_log import HeLogger
+        first = HeLogger("test_remove", 10, "%Y%m%d", file_has_tstamp=False)
+        first.info("old run")
+        second = HeLogger("test_remove", 10, "%Y%m%d", file_has_tstamp=False, remove_previous=True)
+        second.info("new run")
+        with open(second.filepath, encoding="utf-8") as f:
+            content = f.read()
+        assert "new run" in content
+        assert "old run" not in content
+
+        first.close_logger()
+        second.close_logger()
+
+    def test_log_helpers_follow_config_logger(self):
+        """Test the log helpers write to config.logger even when it is assigned directly."""
+        from types import SimpleNamespace
+        from hydraulic_engine.config import config
+        from hydraulic_engine.utils import tools_log
+        messages = []
+        previous = config.logger
+        config.logger = SimpleNamespace(info=lambda text, **kwargs: messages.append(text))
+        try:
+            tools_log.log_info("direct")
+        finally:
+            config.logger = previous
+        assert messages == ["direct"]
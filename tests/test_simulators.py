@@ -0,0 +1,101 @@
+"""
+Copyright © 2026 by BGEO. All rights reserved.
+The program is free software: you can redistribute it and/or modify it under the terms of the GNU
+General Public License as published by the Free Software Foundation, either version 3 of the License,
+or (at your option) any later version.
+
+Runner and INP handler tests shared by the EPANET and SWMM modules.
+"""
+# -*- coding: utf-8 -*-
+from typing import NamedTuple
+
+import pytest
+
+
+class SimSpec(NamedTuple):
+    """Classes of one simulator under test."""
+    name: str
+    runner: type
+    inp_handler: type
+
+
+@pytest.fixture(scope="module", params=["epanet", "swmm"])
+def sim(request) -> SimSpec:
+    """Return the runner and INP handler classes of each simulator."""
+    if request.param == "epanet":
+        from hydraulic_engine.epanet import EpanetRunner, EpanetInpHandler
+        return SimSpec("epanet", EpanetRunner, EpanetInpHandler)
+    from hydraulic_engine.swmm import SwmmRunner, SwmmInpHandler
+    return SimSpec("swmm", SwmmRunner, SwmmInpHandler)
+
+
+class TestRunner:
+    """Test EpanetRunner and SwmmRunner."""
+
+    def test_runner_initialization(self, sim):
+        """Test the runner can be initialized."""
+        runner = sim.runner()
+        assert runner is not None
+        assert runner.result is None
+
+    def test_run_missing_file(self, sim):
+        """Test running with missing INP file."""
+        from hydraulic_engine.utils.enums import RunStatus
+
+        runner = sim.runner(inp_path="nonexistent.inp")
+        result = runner.run()
+
+        assert result.status == RunStatus.ERROR
+        assert len(result.errors) > 0
+        assert "not found" in result.errors[0].lower()
+
+    def test_progress_callback(self, sim):
+        """Test progress callback functionality."""
+        progress_calls = []
+
+        def callback(progress, message):
+            progress_calls.append((progress, message))
+
+        runner = sim.runner(progress_callback=callback)
+        runner._report_progress(50, "Test message")
+
+        assert progress_calls == [(50, "Test message")]
+
+
+class TestInpHandler:
+    """Test EpanetInpHandler and SwmmInpHandler."""
+
+    def test_handler_initialization(self, sim):
+        """Test the INP handler can be initialized."""
+        handler = sim.inp_handler()
+        assert handler.file_path is None
+        assert handler.file_object is None
+
+    def test_is_loaded_false(self, sim):
+        """Test is_loaded returns False when no file loaded."""
+        handler = sim.inp_handler()
+        assert handler.is_loaded() is False
+
+    def test_read_missing_file(self, sim):
+        """Test reading missing file."""
+        from hydraulic_engine.exceptions import FileLoadError
+
+        handler = sim.inp_handler()
+        with pytest.raises(FileLoadError):
+            handler.load_file("nonexistent.inp")
+        assert handler.error_msg is not None
+
+    def test_validate_missing_file(self, sim):
+        """Test validating missing INP file."""
+        handler = sim.inp_handler()
+        handler.file_path = "nonexistent.inp"
+        validation = handler.validate_inp()
+
+        assert validation["valid"] is False
+        assert len(validation["errors"]) > 0
+
+    def test_get_summary_not_loaded(self, sim):
+        """Test get_summary when no file loaded."""
+        handler = sim.inp_handler()
+        summary = handler.get_summary()
+        assert summary["loaded"] is False
@@ -35,87 +35,6 @@ class TestSwmmImports:
         assert SwmmRunStatus is not None
 
 
-class TestSwmmRunner:
-    """Test SwmmRunner class."""
-
-    def test_runner_initialization(self):
-        """Test SwmmRunner can be initialized."""
-        from hydraulic_engine import SwmmRunner
-        runner = SwmmRunner()
-        assert runner is not None
-
-    def test_run_missing_file(self):
-        """Test running with missing INP file."""
-        from hydraulic_engine import SwmmRunner
-        from hydraulic_engine.core.swmm.runner import SwmmRunStatus
-        
-        runner = SwmmRunner()
-        result = runner.run("nonexistent.inp")
-        
-        assert result.status == SwmmRunStatus.ERROR
-        assert len(result.errors) > 0
-        assert "not found" in result.errors[0].lower()
-
-    def test_validate_missing_file(self):
-        """Test validating missing INP file."""
-        from hydraulic_engine import SwmmRunner
-        
-        runner = SwmmRunner()
-        validation = runner.validate_inp("nonexistent.inp")
-        
-        assert validation["valid"] is False
-        assert len(validation["errors"]) > 0
-
-    def test_progress_callback(self):
-        """Test progress callback functionality."""
-        from hydraulic_engine import SwmmRunner
-        
-        progress_calls = []
-        
-        def callback(progress, message):
-            progress_calls.append((progress, message))
-        
-        runner = SwmmRunner()
-        runner.set_progress_callback(callback)
-        runner._report_progress(50, "Test message")
-        
-        assert len(progress_calls) == 1
-        assert progress_calls[0] == (50, "Test message")
-
-
-class TestSwmmInpHandler:
-    """Test SwmmInpHandler class."""
-
-    def test_handler_initialization(self):
-        """Test SwmmInpHandler can be initialized."""
-        from hydraulic_engine import SwmmInpHandler
-        handler = SwmmInpHandler()
-        assert handler is not None
-        assert handler.inp_path is None
-        assert handler.inp is None
-
-    def test_is_loaded_false(self):
-        """Test is_loaded returns False when no file loaded."""
-        from hydraulic_engine import SwmmInpHandler
-        handler = SwmmInpHandler()
-        assert handler.is_loaded() is False
-
-    def test_read_missing_file(self):
-        """Test reading missing file."""
-        from hydraulic_engine import SwmmInpHandler
-        handler = SwmmInpHandler()
-        result = handler.read("nonexistent.inp")
-        assert result is False
-        assert handler.error_msg is not None
-
-    def test_get_summary_not_loaded(self):
-        """Test get_summary when no file loaded."""
-        from hydraulic_engine import SwmmInpHandler
-        handler = SwmmInpHandler()
-        summary = handler.get_summary()
-        assert summary["loaded"] is False
-
-
 class TestSwmmRptHandler:
     """Test SwmmRptHandler class."""
 
@@ -147,6 +66,34 @@ class TestSwmmRptHandler:
         summary = handler.get_summary()
         assert summary["loaded"] is False
 
+    def test_get_summary_cached_per_file(self, tmp_path):
+        """Test get_summary is built once per loaded report and rebuilt for a new one."""
+        from types import SimpleNamespace
+        from hydraulic_engine.swmm import SwmmRptHandler
+        rpt_path = tmp_path / "result.rpt"
+        rpt_path.write_text("Analysis begun\nWARNING 04: minimum elevation drop used\n", encoding="utf-8")
+
+        handler = SwmmRptHandler()
+        handler.file_path = str(rpt_path)
+        handler.file_object = SimpleNamespace()
+        summary = handler.get_summary()
+        assert summary["loaded"] is True
+        assert summary["successful"] is True
+        assert len(summary["warnings"]) == 1
+        assert summary["errors"] == []
+
+        # Cached: the report is not read again, and callers get their own copy
+        rpt_path.write_text("ERROR 200: one or more errors\n", encoding="utf-8")
+        summary["loaded"] = False
+        assert handler.get_summary()["loaded"] is True
+        assert handler.get_summary()["errors"] == []
+
+        # Loading another report object rebuilds it
+        handler.file_object = SimpleNamespace()
+        summary = handler.get_summary()
+        assert summary["successful"] is False
+        assert len(summary["errors"]) == 1
+
 
 class TestSwmmIntegration:
     """Integration tests for SWMM module (require swmm-api)."""